@@ -0,0 +1,125 @@
+"""Measure the memory used per model object.
+
+Builds many objects of a few common models from representative API payloads and reports the bytes allocated per
+object with tracemalloc, including the objects nested in them. Run from the repository root, with the repository on
+the path:
+
+    PYTHONPATH=. python benchmarks/model_memory.py [count]
+"""
+import gc
+import sys
+import tracemalloc
+
+from spotifyapi.models import FullTrack, Image, PlaylistTrack, SimplifiedArtist
+
+ARTIST = {
+    "external_urls": {
+        "spotify": "https://open.spotify.com/artist/0OdUWJ0sBjDrqHygGUXeCF"
+    },
+    "href": "https://api.spotify.com/v1/artists/0OdUWJ0sBjDrqHygGUXeCF",
+    "id": "0OdUWJ0sBjDrqHygGUXeCF",
+    "name": "Band of Horses",
+    "type": "artist",
+    "uri": "spotify:artist:0OdUWJ0sBjDrqHygGUXeCF",
+}
+
+IMAGE = {"height": 640, "url": "https://i.scdn.co/image/ab67616d0000b273", "width": 640}
+
+TRACK = {
+    "album": {
+        "album_type": "album",
+        "artists": [ARTIST],
+        "external_urls": {
+            "spotify": "https://open.spotify.com/album/0sNOF9WDwhWunNAHPD3Baj"
+        },
+        "href": "https://api.spotify.com/v1/albums/0sNOF9WDwhWunNAHPD3Baj",
+        "id": "0sNOF9WDwhWunNAHPD3Baj",
+        "images": [IMAGE, IMAGE, IMAGE],
+        "name": "Everything All the Time",
+        "release_date": "2006-03-21",
+        "release_date_precision": "day",
+        "type": "album",
+        "uri": "spotify:album:0sNOF9WDwhWunNAHPD3Baj",
+    },
+    "artists": [ARTIST],
+    "disc_number": 1,
+    "duration_ms": 318186,
+    "explicit": False,
+    "external_ids": {"isrc": "USSUB0605101"},
+    "external_urls": {
+        "spotify": "https://open.spotify.com/track/5jvjmj4ZkdBbkLHKBQ7oNU"
+    },
+    "href": "https://api.spotify.com/v1/tracks/5jvjmj4ZkdBbkLHKBQ7oNU",
+    "id": "5jvjmj4ZkdBbkLHKBQ7oNU",
+    "is_local": False,
+    "name": "The Funeral",
+    "popularity": 71,
+    "preview_url": None,
+    "track_number": 4,
+    "type": "track",
+    "uri": "spotify:track:5jvjmj4ZkdBbkLHKBQ7oNU",
+}
+
+PLAYLIST_TRACK = {
+    "added_at": "2020-01-01T00:00:00Z",
+    "added_by": None,
+    "is_local": False,
+    "primary_color": None,
+    "track": TRACK,
+    "video_thumbnail": {"url": None},
+}
+
+
+def build_nested(track):
+    # Build the nested objects too, so they are part of the measurement
+    list(track.artists)
+    list(track.album.artists)
+    list(track.album.images)
+
+
+def build_full_track(data):
+    track = FullTrack(data)
+    build_nested(track)
+    return track
+
+
+def build_playlist_track(data):
+    item = PlaylistTrack(data)
+    build_nested(item.track)
+    return item
+
+
+def measure(factory, data, count):
+    """Get the number of bytes allocated per object built by factory."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    objects = [factory(data) for _ in range(count)]
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del objects
+    return (after - before) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    cases = [
+        ("Image", Image, IMAGE),
+        ("SimplifiedArtist", SimplifiedArtist, ARTIST),
+        ("FullTrack", FullTrack, TRACK),
+        ("FullTrack, nested objects built", build_full_track, TRACK),
+        ("PlaylistTrack, nested objects built", build_playlist_track, PLAYLIST_TRACK),
+    ]
+
+    print(f"{'model':<36}{'bytes/object':>14}")
+
+    for name, factory, data in cases:
+        print(f"{name:<36}{measure(factory, data, count):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""Stress a single SpotifyEndpoint shared by many threads.
+
+Runs a local stub of the Web API whose access tokens expire every second, then has every thread fetch tracks through
+the same endpoint for a while. Reports the requests made, the errors, the number of token refreshes and the number of
+connections opened. Run from the repository root, with the repository on the path:
+
+    PYTHONPATH=. python benchmarks/thread_stress.py [threads] [seconds]
+
+The run fails with exit status 1 and says why if any request fails, if the token was refreshed more than once per
+lifetime or if more connections were opened than there are threads.
+"""
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from requests_oauthlib import OAuth2Session
+
+from spotifyapi.endpoints import SpotifyEndpoint
+from spotifyapi.utils.token import TokenManager
+
+# The stub is served over plain HTTP on localhost
+os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"
+
+# Tokens are refreshed DEFAULT_MARGIN seconds before they expire, so this makes them last a second
+TOKEN_LIFETIME = TokenManager.DEFAULT_MARGIN + 1
+
+
+class Stub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+
+        self.lock = threading.Lock()
+        self.counter = itertools.count()
+        self.tokens = {}
+        self.refreshes = 0
+        self.connections = 0
+
+    def issue_token(self):
+        with self.lock:
+            token = f"token-{next(self.counter)}"
+            self.tokens[token] = time.time() + TOKEN_LIFETIME
+
+            return token
+
+    def token_valid(self, token):
+        with self.lock:
+            return self.tokens.get(token, 0) > time.time()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # Keep connections alive so they can be reused
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        token = self.headers.get("Authorization", "").replace("Bearer ", "")
+
+        if not self.server.token_valid(token):
+            self.reply(
+                401, {"error": {"status": 401, "message": "The access token expired"}}
+            )
+            return
+
+        id = self.path.rsplit("/", 1)[-1]
+        self.reply(200, track(id))
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        with self.server.lock:
+            self.server.refreshes += 1
+
+        # Widen the window in which other threads could start refreshing too
+        time.sleep(0.05)
+
+        self.reply(
+            200,
+            {
+                "access_token": self.server.issue_token(),
+                "token_type": "Bearer",
+                "expires_in": TOKEN_LIFETIME,
+                "refresh_token": "refresh",
+            },
+        )
+
+    def reply(self, status, data):
+        body = json.dumps(data).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def track(id):
+    return {
+        "album": {
+            "album_type": "album",
+            "artists": [],
+            "external_urls": {},
+            "href": "",
+            "id": "album",
+            "images": [],
+            "name": "Album",
+            "release_date": "2020",
+            "release_date_precision": "year",
+            "type": "album",
+            "uri": "spotify:album:album",
+        },
+        "artists": [],
+        "disc_number": 1,
+        "duration_ms": 1000,
+        "explicit": False,
+        "external_ids": {},
+        "external_urls": {},
+        "href": "",
+        "id": id,
+        "is_local": False,
+        "name": f"Track {id}",
+        "popularity": 0,
+        "preview_url": None,
+        "track_number": 1,
+        "type": "track",
+        "uri": f"spotify:track:{id}",
+    }
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    stub = Stub()
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{stub.server_address[1]}"
+
+    oauth = OAuth2Session(
+        "client",
+        token={
+            "access_token": stub.issue_token(),
+            "token_type": "Bearer",
+            "expires_in": TOKEN_LIFETIME,
+            "expires_at": time.time() + TOKEN_LIFETIME,
+            "refresh_token": "refresh",
+        },
+        auto_refresh_url=f"{base}/api/token",
+        auto_refresh_kwargs={"client_id": "client", "client_secret": "secret"},
+        token_updater=lambda token: None,
+    )
+
+    spotify = SpotifyEndpoint(oauth, pool_maxsize=threads, pool_block=True)
+
+    # Point the endpoint at the stub instead of the Web API
+    spotify._base_url = f"{base}/v1"
+
+    deadline = time.time() + seconds
+    lock = threading.Lock()
+    requests = 0
+    errors = []
+
+    def worker(n):
+        nonlocal requests
+
+        while time.time() < deadline:
+            try:
+                spotify.get_track(f"{n}-{requests}")
+            except Exception as e:
+                errors.append(e)
+
+            with lock:
+                requests += 1
+
+    with spotify, ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, range(threads)))
+
+    stub.shutdown()
+
+    lifetimes = seconds / (TOKEN_LIFETIME - TokenManager.DEFAULT_MARGIN)
+
+    print(f"threads      {threads}")
+    print(f"requests     {requests} ({requests / seconds:.0f}/s)")
+    print(f"errors       {len(errors)}")
+    print(f"refreshes    {stub.refreshes} (token lifetimes: {lifetimes:.0f})")
+    print(f"connections  {stub.connections}")
+
+    for error in errors[:5]:
+        print(f"  {type(error).__name__}: {error}")
+
+    failures = []
+
+    if not requests:
+        failures.append("no requests were made")
+
+    if errors:
+        failures.append(f"{len(errors)} requests failed")
+
+    # Allow for a refresh at the end of the run that the last lifetime didn't need
+    if stub.refreshes > lifetimes + 1:
+        failures.append(
+            f"the token was refreshed {stub.refreshes} times in {lifetimes:.0f} lifetimes"
+        )
+
+    if stub.connections > threads:
+        failures.append(
+            f"{stub.connections} connections were opened for {threads} threads"
+        )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
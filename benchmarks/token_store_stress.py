@@ -0,0 +1,126 @@
+"""Stress a token shared by many processes through a SQLiteTokenStore.
+
+Runs the stub of thread_stress.py, whose access tokens expire every second, then has every process fetch tracks with
+its own session and endpoint while they share their token through one store. Reports the requests made, the errors
+and the number of token refreshes. Run from the repository root, with the repository on the path:
+
+    PYTHONPATH=. python benchmarks/token_store_stress.py [processes] [seconds] [--no-store]
+
+With --no-store every process refreshes its own token, for comparison. The run fails with exit status 1 and says why if
+any request fails or, with the store, if the token was refreshed more than once per lifetime.
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from requests_oauthlib import OAuth2Session
+
+from spotifyapi.endpoints import SpotifyEndpoint
+from spotifyapi.utils.token import SQLiteTokenStore, TokenManager
+from thread_stress import TOKEN_LIFETIME, Stub
+
+# The stub is served over plain HTTP on localhost
+os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"
+
+
+def worker(n, base, token, path, deadline):
+    oauth = OAuth2Session(
+        "client",
+        token=token,
+        auto_refresh_url=f"{base}/api/token",
+        auto_refresh_kwargs={"client_id": "client", "client_secret": "secret"},
+        token_updater=lambda token: None,
+    )
+    store = SQLiteTokenStore(path) if path else None
+    spotify = SpotifyEndpoint(
+        oauth, token_manager=TokenManager(oauth, store, key="user")
+    )
+
+    # Point the endpoint at the stub instead of the Web API
+    spotify._base_url = f"{base}/v1"
+
+    requests = 0
+    errors = []
+
+    with spotify:
+        while time.time() < deadline:
+            try:
+                spotify.get_track(f"{n}-{requests}")
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+
+            requests += 1
+
+    return requests, errors
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    processes = int(args[0]) if len(args) > 0 else 8
+    seconds = float(args[1]) if len(args) > 1 else 5
+    shared = "--no-store" not in sys.argv
+
+    stub = Stub()
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{stub.server_address[1]}"
+
+    token = {
+        "access_token": stub.issue_token(),
+        "token_type": "Bearer",
+        "expires_in": TOKEN_LIFETIME,
+        "expires_at": time.time() + TOKEN_LIFETIME,
+        "refresh_token": "refresh",
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tokens.db") if shared else None
+        deadline = time.time() + seconds
+
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.starmap(
+                worker, [(n, base, token, path, deadline) for n in range(processes)]
+            )
+
+    stub.shutdown()
+
+    requests = sum(count for count, _ in results)
+    errors = [error for _, errors in results for error in errors]
+    lifetimes = seconds / (TOKEN_LIFETIME - TokenManager.DEFAULT_MARGIN)
+
+    print(f"processes    {processes}")
+    print(f"store        {'shared' if shared else 'none'}")
+    print(f"requests     {requests} ({requests / seconds:.0f}/s)")
+    print(f"errors       {len(errors)}")
+    print(f"refreshes    {stub.refreshes} (token lifetimes: {lifetimes:.0f})")
+
+    for error in errors[:5]:
+        print(f"  {error}")
+
+    failures = []
+
+    if not requests:
+        failures.append("no requests were made")
+
+    if errors:
+        failures.append(f"{len(errors)} requests failed")
+
+    # Allow for a refresh at the end of the run that the last lifetime didn't need
+    if shared and stub.refreshes > lifetimes + 1:
+        failures.append(
+            f"the token was refreshed {stub.refreshes} times in {lifetimes:.0f} lifetimes"
+        )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import os
+from pathlib import Path
+
+from spotifyapi.endpoints import SpotifyEndpoint
+from spotifyapi.authorization.client_credentials import ClientCredentialsSession
+from spotifyapi.utils.token import SQLiteTokenStore, TokenManager
+
+# You will either need to set these environment variables or hard-code them here.
+CLIENT_ID = os.environ.get("SPOTIFY_CLIENT_ID")
+CLIENT_SECRET = os.environ.get("SPOTIFY_CLIENT_SECRET")
+
+# The client credentials flow authorizes the application itself, so there is no user to send to the authorization page.
+# It can only read the catalog, such as tracks, albums, artists and their audio features and analyses.
+oauth = ClientCredentialsSession(CLIENT_ID, CLIENT_SECRET)
+
+# Optionally, keep the token in a store so every worker process using the same file shares one token instead of
+# fetching its own. The token is fetched before the first request and a new one shortly before it expires.
+token_path = Path(os.path.dirname(os.path.abspath(__file__))).joinpath(
+    Path(".cache/tokens.db")
+)
+token_manager = TokenManager(oauth, SQLiteTokenStore(str(token_path)))
+
+with SpotifyEndpoint(oauth, token_manager=token_manager) as spotify:
+    track = spotify.get_track("4uLU6hMCjMI75M1A2tKUQC")
+    features = spotify.get_audio_features(track)
+
+    print(f"{track.name} has a tempo of {features.tempo} BPM")
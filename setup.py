@@ -20,4 +20,5 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     install_requires=["requests"],
+    extras_require={"async": ["aiohttp"], "fast": ["orjson"], "numpy": ["numpy"]},
 )
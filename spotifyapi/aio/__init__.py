@@ -0,0 +1,36 @@
+"""Provide the asyncio client.
+
+Requires the optional aiohttp dependency, e.g. ``pip install spotifyapi[async]``.
+"""
+import aiohttp
+from typing import Optional
+from requests_oauthlib import OAuth2Session
+
+from .album import AsyncAlbumEndpoint
+from .artist import AsyncArtistEndpoint
+from .library import AsyncLibraryEndpoint
+from .player import AsyncPlayerEndpoint
+from .playlist import AsyncPlaylistEndpoint
+from .track import AsyncTrackEndpoint
+from .user import AsyncUserEndpoint
+
+
+class AsyncSpotifyEndpoint(
+    AsyncAlbumEndpoint,
+    AsyncArtistEndpoint,
+    AsyncLibraryEndpoint,
+    AsyncPlayerEndpoint,
+    AsyncPlaylistEndpoint,
+    AsyncTrackEndpoint,
+    AsyncUserEndpoint,
+):
+    """Asyncio endpoint class that has functionality of all endpoints. Keyword arguments are the options of
+    AsyncEndpointBase."""
+
+    def __init__(
+        self,
+        oauth: OAuth2Session,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs,
+    ):
+        super().__init__(oauth, session, **kwargs)
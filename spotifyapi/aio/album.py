@@ -0,0 +1,120 @@
+"""Provide the asyncio album endpoint."""
+import aiohttp
+from typing import AsyncGenerator, List, Optional
+from requests_oauthlib import OAuth2Session
+
+from .base import AsyncEndpointBase
+from ..models import Album, FullAlbum, SimplifiedTrack
+from ..utils import agenerate, amap_chunks
+
+
+class AsyncAlbumEndpoint(AsyncEndpointBase):
+    """Endpoints for retrieving information about one or more albums from the Spotify catalog."""
+
+    def __init__(
+        self,
+        oauth: OAuth2Session,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs,
+    ):
+        super().__init__(oauth, session, **kwargs)
+
+        self._albums = f"{self._base_url}/albums"
+        self._album_loader = self._batch_loader(self.__load_albums, 20)
+
+    async def get_album(self, id: str) -> FullAlbum:
+        """Get Spotify catalog information for a single album.
+
+        Args:
+            id: The Spotify ID for the album.
+
+        Returns:
+            The album with specified ID.
+        """
+        if self._album_loader:
+            response = await self._album_loader.load(id)
+        else:
+            response = await self._get(f"{self._albums}/{id}")
+
+        return self._build(FullAlbum, response)
+
+    async def get_album_tracks(
+        self,
+        album: Album,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
+    ) -> AsyncGenerator[SimplifiedTrack, None]:
+        """Get Spotify catalog information about an album’s tracks. Optional parameters can be used to limit the number
+            of tracks returned.
+
+        Args:
+            album: The Album object.
+            limit: The maximum number of tracks to return. Default: 50. Minimum: 1. Maximum: 50.
+            offset: The index of the first track to return. Use with limit to get the next set of tracks.
+            workers: If given, fetch the remaining pages concurrently with at most this many requests in flight.
+                Default: one page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
+
+        Returns:
+            An async generator of simplified tracks.
+        """
+        # If limit is specified, check that it is a legitimate value
+        if limit and not 1 <= limit <= 50:
+            raise ValueError("limit must be between 1 and 50")
+
+        if offset and not limit:
+            raise ValueError("limit must be used with offset")
+
+        params = {"limit": limit or 50, "offset": offset}
+
+        response = await self._get(f"{self._albums}/{album.id}/tracks", params=params)
+
+        return agenerate(
+            response, SimplifiedTrack, self._get, workers, prefetch, raw=self._raw
+        )
+
+    async def get_albums(self, ids: List[str]) -> List[Optional[FullAlbum]]:
+        """Get Spotify catalog information for multiple albums identified by their Spotify IDs.
+
+        Args:
+            ids: A list of the Spotify IDs for the albums. Maximum: 20 IDs.
+
+        Returns:
+            List of albums for IDs. IDs not corresponding to an album give None.
+        """
+        if len(ids) > 20:
+            raise ValueError("Maximum album ID count is 20")
+
+        params = {"ids": ",".join(ids)}
+
+        response = await self._get(f"{self._albums}", params=params)
+
+        return [
+            self._build(FullAlbum, data) if data else None
+            for data in response["albums"]
+        ]
+
+    async def get_albums_bulk(
+        self, ids: List[str], workers: int = 4
+    ) -> List[Optional[FullAlbum]]:
+        """Get Spotify catalog information for any number of albums identified by their Spotify IDs. The IDs are split
+        into requests of 20 that are sent concurrently.
+
+        Args:
+            ids: A list of the Spotify IDs for the albums.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            List of albums for IDs, in the same order. IDs not corresponding to an album give None.
+        """
+        return await amap_chunks(self.get_albums, ids, 20, workers)
+
+    async def __load_albums(self, ids: List[str]) -> List[Optional[dict]]:
+        params = {"ids": ",".join(ids)}
+
+        response = await self._get(f"{self._albums}", params=params)
+
+        return response["albums"]
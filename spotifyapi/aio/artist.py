@@ -0,0 +1,169 @@
+"""Provide the asyncio artist endpoint."""
+import aiohttp
+from typing import AsyncGenerator, List, Optional
+from requests_oauthlib import OAuth2Session
+
+from .base import AsyncEndpointBase
+from ..models import Artist, FullArtist, FullTrack, SimplifiedAlbum
+from ..utils import agenerate, amap_chunks
+
+
+class AsyncArtistEndpoint(AsyncEndpointBase):
+    """Endpoints for retrieving information about one or more artists from the Spotify catalog."""
+
+    def __init__(
+        self,
+        oauth: OAuth2Session,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs,
+    ):
+        super().__init__(oauth, session, **kwargs)
+
+        self._artists = f"{self._base_url}/artists"
+        self._artist_loader = self._batch_loader(self.__load_artists, 50)
+
+    async def get_artist(self, id: str) -> FullArtist:
+        """Get Spotify catalog information for a single artist.
+
+        Args:
+            id: The Spotify Id for the artist.
+
+        Returns:
+            The artist with the specified ID.
+        """
+        if self._artist_loader:
+            response = await self._artist_loader.load(id)
+        else:
+            response = await self._get(f"{self._artists}/{id}")
+
+        return self._build(FullArtist, response)
+
+    async def get_artist_albums(
+        self,
+        artist: Artist,
+        include_groups: Optional[List[str]] = None,
+        country: Optional[str] = "US",
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
+    ) -> AsyncGenerator[SimplifiedAlbum, None]:
+        """Get Spotify catalog information about an artist’s albums.
+
+        Args:
+            artist: The Artist object.
+            include_groups: A comma-separated list of keywords that will be used to filter the response.
+                If not supplied, all album types will be returned. Valid values are:
+                    - album
+                    - single
+                    - appears_on
+                    - compilation
+                For example: include_groups=album,single.
+            country: An ISO 3166-1 alpha-2 country code or the string from_token.
+                Supply this parameter to limit the response to one particular geographical market. For example, for
+                albums available in Sweden: country=SE. If not given, results will be returned for all countries and you
+                are likely to get duplicate results per album, one for each country in which the album is available!
+            limit: The number of album objects to return. Default: 50. Minimum: 1. Maximum: 50. For example: limit=2
+            offset: The index of the first album to return. Default: 0 (i.e., the first album). Use with limit to get
+                the next set of albums.
+            workers: If given, fetch the remaining pages concurrently with at most this many requests in flight.
+                Default: one page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
+        Returns:
+            An async generator of the artist's albums.
+        """
+        # If limit is specified, check that it is a legitimate value
+        if limit and not 1 <= limit <= 50:
+            raise ValueError("limit must be between 1 and 50")
+
+        if offset and not limit:
+            raise ValueError("limit must be used with offset")
+
+        params = {"country": country, "limit": limit or 50, "offset": offset}
+
+        if include_groups:
+            params["include_groups"] = ",".join(include_groups)
+
+        response = await self._get(f"{self._artists}/{artist.id}/albums", params=params)
+
+        return agenerate(
+            response, SimplifiedAlbum, self._get, workers, prefetch, raw=self._raw
+        )
+
+    async def get_artist_top_tracks(
+        self, artist: Artist, country: str = "US"
+    ) -> List[FullTrack]:
+        """Get Spotify catalog information about an artist’s top tracks by country.
+
+        Args:
+            artist: The Artist object.
+            country: An ISO 3166-1 alpha-2 country code or the string from_token.
+
+        Returns:
+            The artist's top tracks by country.
+        """
+        params = {"country": country}
+
+        if not country:
+            raise ValueError("Country must be defined")
+
+        response = await self._get(
+            f"{self._artists}/{artist.id}/top-tracks", params=params
+        )
+
+        return [self._build(FullTrack, track) for track in response["tracks"]]
+
+    async def get_related_artists(self, artist: Artist) -> List[FullArtist]:
+        """Get Spotify catalog information about artists similar to a given artist. Similarity is based on analysis of
+        the Spotify community’s listening history.
+
+        Args:
+            artist: The Artist object.
+
+        Returns:
+            Artists similar to the given artist.
+        """
+        response = await self._get(f"{self._artists}/{artist.id}/related-artists")
+
+        return [self._build(FullArtist, artist) for artist in response["artists"]]
+
+    async def get_artists(self, ids: List[str]) -> List[FullArtist]:
+        """Get Spotify catalog information for several artists
+
+        Args:
+            ids: The Spotify Id for the artist.
+
+        Returns:
+            Information on several artists.
+        """
+        if len(ids) > 50:
+            raise ValueError("Maximum artist ID count is 50")
+
+        params = {"ids": ",".join(ids)}
+
+        response = await self._get(f"{self._artists}", params=params)
+
+        return [self._build(FullArtist, artist) for artist in response["artists"]]
+
+    async def get_artists_bulk(
+        self, ids: List[str], workers: int = 4
+    ) -> List[FullArtist]:
+        """Get Spotify catalog information for any number of artists. The IDs are split into requests of 50 that are
+        sent concurrently.
+
+        Args:
+            ids: The Spotify IDs for the artists.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            Information on the artists, in the same order.
+        """
+        return await amap_chunks(self.get_artists, ids, 50, workers)
+
+    async def __load_artists(self, ids: List[str]) -> List[Optional[dict]]:
+        params = {"ids": ",".join(ids)}
+
+        response = await self._get(f"{self._artists}", params=params)
+
+        return response["artists"]
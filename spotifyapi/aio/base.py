@@ -0,0 +1,280 @@
+"""Provide the asyncio endpoint superclass."""
+import aiohttp
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from requests_oauthlib import OAuth2Session
+
+from ..exceptions import ExpiredTokenError, SpotifyAPIError
+from ..utils.batch import AsyncBatchLoader
+from ..utils.cache import ETagCache, SQLiteCache, cache_key
+from ..utils.codec import Codec, default_codec
+from ..utils.retry import RetryPolicy
+from ..utils.scheduler import RequestScheduler
+from ..utils.token import TokenManager
+
+
+class AsyncEndpointBase:
+    """Base asyncio endpoint functionality.
+
+    Identical GET requests made at the same time from several tasks share one network call and its decoded body.
+
+    Args:
+        oauth: The session holding the token requests are authorized with.
+        session: The aiohttp session used to send requests. Default: one created and closed by the endpoint.
+        scheduler: The scheduler every request and paging fetch goes through. It may be shared with other endpoints,
+            including synchronous ones. Default: a scheduler that only honors Retry-After.
+        retry: The policy for retrying connection errors, timeouts and 5xx responses. GET, PUT and DELETE requests
+            are retried automatically, POST requests only when the caller opts in. Default: RetryPolicy().
+        cache: If given, the cache GET responses are kept in, such as an ETagCache or a SQLiteCache. Cached responses
+            are used as is while fresh and revalidated with If-None-Match otherwise. It may be shared with other
+            endpoints, including synchronous ones.
+        batch_window: If given, get_track, get_album, get_artist and get_audio_features for a single track wait this
+            many seconds for identical calls from other tasks and send them together through the endpoint for several
+            objects.
+        codec: The codec request bodies are encoded and response bodies decoded with, including paging fetches.
+            Default: an OrjsonCodec if orjson is installed, otherwise a JSONCodec.
+        raw: If true, methods return and generators yield the decoded JSON of the API, such as dicts and lists of
+            dicts, instead of models. Arguments are still models. Responses may be shared with a cache and with other
+            callers, so they must not be modified.
+        timeout: The timeout, in seconds, of every request, either one for both connecting and reading or a (connect,
+            read) tuple. None waits forever. Default: DEFAULT_TIMEOUT.
+        pool_maxsize: If given, the maximum number of connections to each host of the session created by the
+            endpoint. Requests wait for a free connection once they are all in use. Ignored if a session is provided.
+        token_manager: The manager that refreshes the token of the session ahead of requests. Refreshes run in the
+            default executor so the event loop is not blocked. It may be shared with other endpoints using the same
+            session, including synchronous ones. Default: TokenManager(oauth).
+    """
+
+    # Connect quickly or fail over to a retry, but give large responses time to arrive
+    DEFAULT_TIMEOUT = (5.0, 30.0)
+
+    # The aiohttp counterparts of RetryPolicy.exceptions
+    retry_exceptions = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+    def __init__(
+        self,
+        oauth: OAuth2Session,
+        session: Optional[aiohttp.ClientSession] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[Union[ETagCache, SQLiteCache]] = None,
+        batch_window: Optional[float] = None,
+        codec: Optional[Codec] = None,
+        raw: bool = False,
+        timeout: Optional[Union[float, Tuple[float, float]]] = DEFAULT_TIMEOUT,
+        pool_maxsize: Optional[int] = None,
+        token_manager: Optional[TokenManager] = None,
+    ):
+        self._oauth = oauth
+        self._base_url = "https://api.spotify.com/v1"
+        self._scheduler = scheduler if scheduler else RequestScheduler()
+        self._retry = retry if retry else RetryPolicy()
+        self._cache = cache
+        self._batch_window = batch_window
+        self._codec = codec if codec else default_codec()
+        self._raw = raw
+        self._pool_maxsize = pool_maxsize
+        self._token_manager = token_manager if token_manager else TokenManager(oauth)
+
+        if isinstance(timeout, tuple):
+            self._timeout = aiohttp.ClientTimeout(
+                sock_connect=timeout[0], sock_read=timeout[1]
+            )
+        else:
+            self._timeout = aiohttp.ClientTimeout(
+                sock_connect=timeout, sock_read=timeout
+            )
+
+        # GET requests currently being sent by cache key, so identical ones can wait for them instead
+        self._in_flight = {}
+
+        # The aiohttp session must be created inside a running event loop, so when one is not provided it is created on
+        # the first request and owned (and closed) by this endpoint.
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session if it was created by this endpoint."""
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+
+    def _build(self, object_factory: Callable[..., Any], data: Any, *args) -> Any:
+        # Skip building the model entirely in raw mode
+        return data if self._raw else object_factory(data, *args)
+
+    def _batch_loader(
+        self, load_many: Callable[[List[str]], Awaitable[List[Any]]], max_size: int
+    ) -> Optional[AsyncBatchLoader]:
+        if self._batch_window is None:
+            return None
+
+        return AsyncBatchLoader(load_many, max_size, self._batch_window)
+
+    async def _delete(self, url: str, **kwargs) -> Any:
+        return await self.__request("DELETE", url, **kwargs)
+
+    async def _get(self, url: str, **kwargs) -> Any:
+        key = cache_key(url, kwargs.get("params"))
+        task = self._in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(self.__get(url, key, **kwargs))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shielded so a caller that is cancelled doesn't cancel the request for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    async def __get(self, url: str, key: str, **kwargs) -> Any:
+        if self._cache is None:
+            return await self.__request("GET", url, **kwargs)
+
+        cached = self._cache.get(key)
+
+        if cached and cached.fresh:
+            return cached.data
+
+        if cached and cached.etag:
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "If-None-Match": cached.etag,
+            }
+
+        status, headers, data = await self.__send("GET", url, **kwargs)
+        etag = headers.get("ETag")
+
+        # The body hasn't changed since it was cached, so skip downloading and parsing it again
+        if cached and status == 304:
+            data, etag = cached.data, etag or cached.etag
+
+        if data is not None:
+            self._cache.set(key, etag, data)
+
+        return data
+
+    async def _get_content(self, url: str, **kwargs) -> bytes:
+        # The body is returned undecoded, so it is neither cached nor shared with identical requests
+        _, _, content = await self.__send("GET", url, decode=False, **kwargs)
+
+        return content
+
+    async def _put(self, url: str, **kwargs) -> Any:
+        return await self.__request("PUT", url, **kwargs)
+
+    async def _post(self, url: str, retry: bool = False, **kwargs) -> Any:
+        # POST requests are not idempotent, so they are only retried if the caller says it is safe
+        return await self.__request("POST", url, retry=retry, **kwargs)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # Unlike requests, aiohttp doesn't limit connections per host unless told to
+            connector = aiohttp.TCPConnector(limit_per_host=self._pool_maxsize or 0)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+
+        return self._session
+
+    @staticmethod
+    def _params(params: Dict[str, Any]) -> Dict[str, str]:
+        # Match requests, which drops None values and sends everything else as its string form
+        return {key: str(value) for key, value in params.items() if value is not None}
+
+    async def __request(self, method: str, url: str, **kwargs) -> Any:
+        _, _, data = await self.__send(method, url, **kwargs)
+
+        return data
+
+    async def __authorize(self, headers: Mapping[str, str]) -> Dict[str, str]:
+        # Refreshing sends a blocking request, so only leave the event loop when the token is expiring
+        if self._token_manager.expiring():
+            await asyncio.get_event_loop().run_in_executor(
+                None, self._token_manager.ensure
+            )
+
+        return {"Authorization": f"Bearer {self._oauth.access_token}", **headers}
+
+    async def __send(
+        self, method: str, url: str, retry: bool = True, decode: bool = True, **kwargs
+    ) -> Tuple[int, Mapping[str, str], Any]:
+        # Serialize data to json, unless it is already an encoded payload such as an image
+        if "data" in kwargs and not isinstance(kwargs["data"], bytes):
+            kwargs["data"] = self._codec.dumps(kwargs["data"])
+
+        if "params" in kwargs:
+            kwargs["params"] = self._params(kwargs["params"])
+
+        headers = kwargs.pop("headers", {})
+
+        kwargs.setdefault("timeout", self._timeout)
+
+        session = self._get_session()
+        retries = self._retry.total if retry else 0
+        attempt = 0
+
+        while True:
+            await self._scheduler.acquire_async()
+
+            # Check the token on every attempt, since it may have expired while waiting for the scheduler or a retry
+            authorized = await self.__authorize(headers)
+
+            try:
+                async with session.request(
+                    method, url, headers=authorized, **kwargs
+                ) as response:
+                    # Queue the request again once the API allows it instead of failing
+                    if response.status == 429:
+                        self._scheduler.pause(
+                            self._scheduler.retry_after(response.headers)
+                        )
+                        continue
+
+                    if attempt < retries and self._retry.is_retryable(response.status):
+                        await asyncio.sleep(self._retry.backoff(attempt))
+                        attempt += 1
+                        continue
+
+                    # Check if there's no content so we don't try to create an instance of something
+                    if response.status in (204, 304):
+                        return response.status, response.headers, None
+
+                    body = await response.read()
+
+                    if not decode and response.status < 400:
+                        return response.status, response.headers, body
+
+                    try:
+                        data = self._codec.loads(body) if body.strip() else None
+                    except ValueError:
+                        # Gateway errors such as 502 do not always come with a JSON body
+                        if response.status < 400:
+                            raise
+                        data = None
+            except self.retry_exceptions:
+                if attempt >= retries:
+                    raise
+
+                await asyncio.sleep(self._retry.backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status >= 400:
+                error = data.get("error") if isinstance(data, dict) else None
+                message = error.get("message") if isinstance(error, dict) else None
+
+                if not message:
+                    raise SpotifyAPIError(
+                        f"{response.status} {response.reason} for url: {response.url}",
+                        response.status,
+                    )
+
+                if "token expired" in message:
+                    raise ExpiredTokenError(self._oauth.access_token)
+                raise SpotifyAPIError(message, response.status)
+
+            return response.status, response.headers, data
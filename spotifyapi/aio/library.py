@@ -0,0 +1,299 @@
+"""Provide the asyncio user library endpoint."""
+import aiohttp
+from typing import AsyncGenerator, List, Optional, Union
+from requests_oauthlib import OAuth2Session
+
+from .base import AsyncEndpointBase
+from ..authorization.decorators import scope
+from ..authorization.scopes import user_library_read, user_library_modify
+from ..models import Album, SavedAlbum, SavedTrack, Track
+from ..utils import agenerate, amap_chunks
+
+
+class AsyncLibraryEndpoint(AsyncEndpointBase):
+    """
+    Endpoints for retrieving information about, and managing, tracks that the current user has saved in their “Your
+    Music” library.
+    """
+
+    def __init__(
+        self,
+        oauth: OAuth2Session,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs,
+    ):
+        super().__init__(oauth, session, **kwargs)
+
+        self._library = f"{self._base_url}/me"
+
+    @scope(user_library_read)
+    async def is_album_saved(
+        self, albums: Union[Album, List[Album]]
+    ) -> Union[bool, List[bool]]:
+        """Check if one or more albums is already saved in the current Spotify user’s ‘Your Music’ library.
+
+        Args:
+            albums: The album or albums to check.
+
+        Raises:
+            ValueError: If more than 50 albums are provided.
+
+        Returns:
+            True/False for one album or a list of True/False for multiple albums.
+        """
+        if isinstance(albums, list):
+            if len(albums) > 50:
+                raise ValueError("Maximum albums to check is 50")
+
+            params = {"ids": ",".join([item.id for item in albums])}
+
+        else:
+            params = {"ids": albums.id}
+
+        response = await self._get(f"{self._library}/albums/contains", params=params)
+
+        return response[0] if len(response) == 1 else response
+
+    @scope(user_library_read)
+    async def is_track_saved(
+        self, tracks: Union[Track, List[Track]]
+    ) -> Union[bool, List[bool]]:
+        """Check if one or more tracks is already saved in the current Spotify user’s ‘Your Music’ library.
+
+        Args:
+            tracks: The track or tracks to check.
+
+        Raises:
+            ValueError: If more than 50 tracks are provided.
+
+        Returns:
+            True/False for one track or a list of True/False for multiple tracks.
+        """
+        if isinstance(tracks, list):
+            if len(tracks) > 50:
+                raise ValueError("Maximum tracks to check is 50")
+
+            params = {"ids": ",".join([item.id for item in tracks])}
+
+        else:
+            params = {"ids": tracks.id}
+
+        response = await self._get(f"{self._library}/tracks/contains", params=params)
+
+        return response[0] if len(response) == 1 else response
+
+    @scope(user_library_read)
+    async def is_track_saved_bulk(
+        self, tracks: List[Track], workers: int = 4
+    ) -> List[bool]:
+        """Check if any number of tracks are already saved in the current Spotify user’s ‘Your Music’ library. The
+        tracks are split into requests of 50 that are sent concurrently.
+
+        Args:
+            tracks: The tracks to check.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            A list of True/False for the tracks, in the same order.
+        """
+
+        async def contains(chunk: List[Track]) -> List[bool]:
+            params = {"ids": ",".join([track.id for track in chunk])}
+
+            return await self._get(f"{self._library}/tracks/contains", params=params)
+
+        return await amap_chunks(contains, tracks, 50, workers)
+
+    @scope(user_library_read)
+    async def get_saved_albums(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
+    ) -> AsyncGenerator[SavedAlbum, None]:
+        """Get a list of the albums saved in the current Spotify user’s ‘Your Music’ library.
+
+        Args:
+            limit: The maximum number of objects to return. Default: 50. Minimum: 1. Maximum: 50.
+            offset: The index of the first object to return. Default: 0 (i.e., the first object). Use with limit to get
+                the next set of objects.
+            workers: If given, fetch the remaining pages concurrently with at most this many requests in flight.
+                Default: one page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
+
+        Raises:
+            ValueError:
+                If specified `limit` is outside the valid range
+                If both `after` and `before` are specified
+
+        Returns:
+            An async generator of saved albums and their timestamps.
+        """
+        if limit and not 1 <= limit <= 50:
+            raise ValueError("limit must be between 1 and 50")
+
+        if offset and not limit:
+            raise ValueError("limit must be used with offset")
+
+        params = {"limit": limit or 50, "offset": offset}
+
+        response = await self._get(f"{self._library}/albums", params=params)
+
+        return agenerate(
+            response, SavedAlbum, self._get, workers, prefetch, raw=self._raw
+        )
+
+    @scope(user_library_read)
+    async def get_saved_tracks(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
+    ) -> AsyncGenerator[SavedTrack, None]:
+        """Get a list of the songs saved in the current Spotify user’s ‘Your Music’ library.
+
+        Args:
+            limit: The maximum number of objects to return. Default: 50. Minimum: 1. Maximum: 50.
+            offset: The index of the first object to return. Default: 0 (i.e., the first object). Use with limit to get
+                the next set of objects.
+            workers: If given, fetch the remaining pages concurrently with at most this many requests in flight.
+                Default: one page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
+
+        Raises:
+            ValueError:
+                If specified `limit` is outside the valid range
+                If both `after` and `before` are specified
+
+        Returns:
+            An async generator of saved tracks and their timestamps.
+        """
+        if limit and not 1 <= limit <= 50:
+            raise ValueError("limit must be between 1 and 50")
+
+        if offset and not limit:
+            raise ValueError("limit must be used with offset")
+
+        params = {"limit": limit or 50, "offset": offset}
+
+        response = await self._get(f"{self._library}/tracks", params=params)
+
+        return agenerate(
+            response, SavedTrack, self._get, workers, prefetch, raw=self._raw
+        )
+
+    @scope(user_library_modify)
+    async def remove_saved_albums(self, albums: Union[Album, List[Album]]):
+        """Remove one or more albums from the current user’s ‘Your Music’ library.
+
+        Changes to a user’s saved albums may not be visible in other Spotify applications immediately.
+
+        Args:
+            albums: The album or albums to be removed.
+
+        Raises:
+            ValueError: If more than 50 albums are provided.
+        """
+        if isinstance(albums, list):
+            if len(albums) > 50:
+                raise ValueError("Maximum albums to remove is 50")
+
+            params = {"ids": ",".join([album.id for album in albums])}
+
+        else:
+            params = {"ids": albums.id}
+
+        await self._delete(f"{self._library}/albums", params=params)
+
+    @scope(user_library_modify)
+    async def remove_saved_tracks(self, tracks: Union[Track, List[Track]]):
+        """Remove one or more tracks from the current user’s ‘Your Music’ library.
+
+        Changes to a user’s saved tracks may not be visible in other Spotify applications immediately.
+
+        Args:
+            tracks: The track or tracks to be removed.
+
+        Raises:
+            ValueError: If more than 50 tracks are provided.
+        """
+        if isinstance(tracks, list):
+            if len(tracks) > 50:
+                raise ValueError("Maximum albums to remove is 50")
+
+            params = {"ids": ",".join([track.id for track in tracks])}
+
+        else:
+            params = {"ids": tracks.id}
+
+        await self._delete(f"{self._library}/tracks", params=params)
+
+    @scope(user_library_modify)
+    async def remove_saved_tracks_bulk(self, tracks: List[Track], workers: int = 4):
+        """Remove any number of tracks from the current user’s ‘Your Music’ library. The tracks are split into requests
+        of 50 that are sent concurrently.
+
+        Changes to a user’s saved tracks may not be visible in other Spotify applications immediately.
+
+        Args:
+            tracks: The tracks to be removed.
+            workers: The maximum number of requests sent at once.
+        """
+        await amap_chunks(self.remove_saved_tracks, tracks, 50, workers)
+
+    @scope(user_library_modify)
+    async def save_albums(self, albums: Union[Album, List[Album]]):
+        """Save one or more albums to the current user’s ‘Your Music’ library.
+
+        Args:
+            albums: The album or albums to save.
+
+        Raises:
+            ValueError: If more than 50 albums are provided.
+        """
+        if isinstance(albums, list):
+            if len(albums) > 50:
+                raise ValueError("Maximum albums to save is 50")
+
+            params = {"ids": ",".join([album.id for album in albums])}
+
+        else:
+            params = {"ids": albums.id}
+
+        await self._put(f"{self._library}/albums", params=params)
+
+    @scope(user_library_modify)
+    async def save_tracks(self, tracks: Union[Track, List[Track]]):
+        """Save one or more tracks to the current user’s ‘Your Music’ library.
+
+        Args:
+            tracks: The track or tracks to save.
+
+        Raises:
+            ValueError: If more than 50 tracks are provided.
+        """
+        if isinstance(tracks, list):
+            if len(tracks) > 50:
+                raise ValueError("Maximum albums to save is 50")
+
+            params = {"ids": ",".join([track.id for track in tracks])}
+
+        else:
+            params = {"ids": tracks.id}
+
+        await self._put(f"{self._library}/tracks", params=params)
+
+    @scope(user_library_modify)
+    async def save_tracks_bulk(self, tracks: List[Track], workers: int = 4):
+        """Save any number of tracks to the current user’s ‘Your Music’ library. The tracks are split into requests of
+        50 that are sent concurrently.
+
+        Args:
+            tracks: The tracks to save.
+            workers: The maximum number of requests sent at once.
+        """
+        await amap_chunks(self.save_tracks, tracks, 50, workers)
@@ -0,0 +1,200 @@
+"""Provide the asyncio track endpoint."""
+import aiohttp
+from typing import List, Optional, Union
+from requests_oauthlib import OAuth2Session
+
+from .base import AsyncEndpointBase
+from ..models import (
+    AudioAnalysis,
+    AudioFeatures,
+    AudioFeaturesBatch,
+    FullTrack,
+    Track,
+)
+from ..utils import amap_chunks
+
+
+class AsyncTrackEndpoint(AsyncEndpointBase):
+    """Endpoints for retrieving information about one or more tracks from the Spotify catalog."""
+
+    def __init__(
+        self,
+        oauth: OAuth2Session,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs,
+    ):
+        super().__init__(oauth, session, **kwargs)
+
+        self._track_loader = self._batch_loader(self.__load_tracks, 50)
+        self._audio_features_loader = self._batch_loader(
+            self.__load_audio_features, 100
+        )
+
+    async def get_audio_analysis(self, track: Track) -> AudioAnalysis:
+        """Get a detailed audio analysis for a single track.
+
+        The Audio Analysis endpoint provides low-level audio analysis for all of the tracks in the Spotify catalog. The
+        Audio Analysis describes the track’s structure and musical content, including rhythm, pitch, and timbre. All
+        information is precise to the audio sample.
+
+        Many elements of analysis include confidence values, a floating-point number ranging from 0.0 to 1.0. Confidence
+        indicates the reliability of its corresponding attribute. Elements carrying a small confidence value should be
+        considered speculative. There may not be sufficient data in the audio to compute the attribute with high
+        certainty.
+
+        The objects of each array of the analysis, such as its segments, are only built when the array is first used.
+        Without a cache, the arrays that are never used are not even decoded from the response body.
+
+        Args:
+            track: The track to get analysis for.
+
+        Returns:
+            Audio analysis for the track.
+        """
+        url = f"{self._base_url}/audio-analysis/{track.id}"
+
+        if self._raw or self._cache is not None:
+            response = await self._get(url)
+
+            return self._build(AudioAnalysis, response)
+
+        # Nothing else needs the decoded body, so only the arrays that are used get decoded
+        return AudioAnalysis.from_json(await self._get_content(url), self._codec.loads)
+
+    async def get_audio_features(
+        self, track: Union[Track, List[Track]]
+    ) -> Union[AudioFeatures, List[AudioFeatures]]:
+        """Get audio feature information for a single or multiple tracks.
+
+        Args:
+            track: Either a single track or a list of tracks (max 100).
+
+        Returns:
+            Audio features for the track or a list of audio features for the tracks.
+        """
+        if type(track) is list:
+            tracks = track
+
+            if len(tracks) > 100:
+                raise ValueError("Maximum track count is 100")
+
+            params = {"ids": ",".join([track.id for track in tracks])}
+
+            response = await self._get(
+                f"{self._base_url}/audio-features", params=params
+            )
+
+            return [
+                self._build(AudioFeatures, data) for data in response["audio_features"]
+            ]
+
+        else:
+            if self._audio_features_loader:
+                response = await self._audio_features_loader.load(track.id)
+            else:
+                response = await self._get(
+                    f"{self._base_url}/audio-features/{track.id}"
+                )
+
+            return self._build(AudioFeatures, response)
+
+    async def get_audio_features_bulk(
+        self, tracks: List[Track], workers: int = 4
+    ) -> List[AudioFeatures]:
+        """Get audio feature information for any number of tracks. The tracks are split into requests of 100 that are
+        sent concurrently.
+
+        Args:
+            tracks: The tracks to get audio features for.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            A list of audio features for the tracks, in the same order.
+        """
+        return await amap_chunks(self.get_audio_features, tracks, 100, workers)
+
+    async def get_audio_features_batch(
+        self, tracks: List[Track], workers: int = 4
+    ) -> AudioFeaturesBatch:
+        """Get audio feature information for any number of tracks as columns, one array per feature, which is faster
+        to build and to scan than a list of audio features. The tracks are split into requests of 100 that are sent
+        concurrently.
+
+        Args:
+            tracks: The tracks to get audio features for.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            The audio features of the tracks, in the same order. Tracks without audio features are left out.
+        """
+        ids = [track.id for track in tracks]
+
+        return AudioFeaturesBatch(
+            await amap_chunks(self.__load_audio_features, ids, 100, workers)
+        )
+
+    async def get_track(self, id: str) -> FullTrack:
+        """Get Spotify catalog information for a single track identified by its unique Spotify ID.
+
+        Args:
+            id: The Spotify ID for the track.
+
+        Returns:
+            A full track for the ID.
+        """
+        if self._track_loader:
+            response = await self._track_loader.load(id)
+        else:
+            response = await self._get(f"{self._base_url}/tracks/{id}")
+
+        return self._build(FullTrack, response)
+
+    async def get_tracks(self, ids: List[str]) -> List[Optional[FullTrack]]:
+        """Get Spotify catalog information for multiple tracks based on their Spotify IDs.
+
+        Args:
+            ids: A list of the Spotify IDs for the tracks. Maximum: 50 IDs.
+
+        Returns:
+            A list of full tracks for IDs. None for IDs that do not correspond with a track.
+        """
+        if len(ids) > 50:
+            raise ValueError("Maximum track ID count is 50")
+
+        params = {"ids": ",".join(ids)}
+
+        response = await self._get(f"{self._base_url}/tracks", params=params)
+
+        return [
+            self._build(FullTrack, data) if data else None
+            for data in response["tracks"]
+        ]
+
+    async def get_tracks_bulk(
+        self, ids: List[str], workers: int = 4
+    ) -> List[Optional[FullTrack]]:
+        """Get Spotify catalog information for any number of tracks based on their Spotify IDs. The IDs are split into
+        requests of 50 that are sent concurrently.
+
+        Args:
+            ids: A list of the Spotify IDs for the tracks.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            A list of full tracks for IDs, in the same order. None for IDs that do not correspond with a track.
+        """
+        return await amap_chunks(self.get_tracks, ids, 50, workers)
+
+    async def __load_tracks(self, ids: List[str]) -> List[Optional[dict]]:
+        params = {"ids": ",".join(ids)}
+
+        response = await self._get(f"{self._base_url}/tracks", params=params)
+
+        return response["tracks"]
+
+    async def __load_audio_features(self, ids: List[str]) -> List[Optional[dict]]:
+        params = {"ids": ",".join(ids)}
+
+        response = await self._get(f"{self._base_url}/audio-features", params=params)
+
+        return response["audio_features"]
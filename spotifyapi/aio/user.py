@@ -0,0 +1,44 @@
+"""Provide the asyncio user endpoint."""
+import aiohttp
+from typing import Optional
+from requests_oauthlib import OAuth2Session
+
+from .base import AsyncEndpointBase
+from ..models import PublicUser, PrivateUser
+
+
+class AsyncUserEndpoint(AsyncEndpointBase):
+    """Endpoints for retrieving information about a user’s profile."""
+
+    def __init__(
+        self,
+        oauth: OAuth2Session,
+        session: Optional[aiohttp.ClientSession] = None,
+        **kwargs,
+    ):
+        super().__init__(oauth, session, **kwargs)
+
+        self._user = f"{self._base_url}"
+
+    async def get_current_user(self) -> PrivateUser:
+        """Get detailed profile information about the current user (including the current user’s username).
+
+        Returns:
+            The current user's profile information.
+        """
+        response = await self._get(f"{self._user}/me")
+
+        return self._build(PrivateUser, response)
+
+    async def get_user(self, id: str) -> PublicUser:
+        """Get public profile information about a Spotify user.
+
+        Args:
+            id: The user’s Spotify user ID.
+
+        Returns:
+            The profile information of the specified user_id.
+        """
+        response = await self._get(f"{self._user}/users/{id}")
+
+        return self._build(PublicUser, response)
@@ -0,0 +1,69 @@
+"""Provide the client credentials flow."""
+from typing import Callable, Optional
+from oauthlib.oauth2 import BackendApplicationClient
+from requests.auth import HTTPBasicAuth
+from requests_oauthlib import OAuth2Session
+
+from . import TOKEN_URL
+
+
+class ClientCredentialsSession(OAuth2Session):
+    """A session authorized as the application itself rather than as a user, for workloads that only read the catalog,
+    such as tracks, albums, artists, audio features and audio analyses. Endpoints that need a user fail with it.
+
+    There is no refresh token in this flow, so refreshing fetches a new token with the client credentials instead.
+    Endpoints fetch the first token before their first request and a new one shortly before it expires, see
+    TokenManager. Give them a TokenManager with a SQLiteTokenStore to share the token between processes instead of
+    fetching one for each of them.
+
+    Args:
+        client_id: The client ID of the application.
+        client_secret: The client secret of the application.
+        token: A token fetched earlier, such as one saved by token_updater. Default: none, so one is fetched.
+        token_updater: Called with every token fetched, for example to save it. Default: one that does nothing, which
+            also keeps OAuth2Session from raising TokenUpdated when it fetches a new token for an expired one itself.
+        token_url: The URL tokens are fetched from. Default: TOKEN_URL.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        token: Optional[dict] = None,
+        token_updater: Optional[Callable[[dict], None]] = None,
+        token_url: str = TOKEN_URL,
+    ):
+        super().__init__(
+            client=BackendApplicationClient(client_id),
+            token=token,
+            auto_refresh_url=token_url,
+            token_updater=token_updater if token_updater else lambda token: None,
+        )
+
+        self._client_secret = client_secret
+
+    def fetch_token(self, token_url: str = TOKEN_URL, **kwargs) -> dict:
+        """Fetch a new token with the client credentials.
+
+        Args:
+            token_url: The URL to fetch the token from. Default: TOKEN_URL.
+            **kwargs: The arguments of OAuth2Session.fetch_token.
+
+        Returns:
+            The new token, which the session is now authorized with.
+        """
+        kwargs.setdefault("auth", HTTPBasicAuth(self.client_id, self._client_secret))
+
+        return super().fetch_token(token_url, **kwargs)
+
+    def refresh_token(self, token_url: str = TOKEN_URL, **kwargs) -> dict:
+        """Replace the token with a new one, since tokens of this flow come without a refresh token.
+
+        Args:
+            token_url: The URL to fetch the token from. Default: TOKEN_URL.
+            **kwargs: Ignored, for compatibility with OAuth2Session.refresh_token.
+
+        Returns:
+            The new token, which the session is now authorized with.
+        """
+        return self.fetch_token(token_url)
@@ -18,7 +18,7 @@ class SpotifyEndpoint(
     TrackEndpoint,
     UserEndpoint,
 ):
-    """Endpoint class that has functionality of all endpoints."""
+    """Endpoint class that has functionality of all endpoints. Keyword arguments are the options of EndpointBase."""
 
-    def __init__(self, oauth: OAuth2Session):
-        super().__init__(oauth)
+    def __init__(self, oauth: OAuth2Session, **kwargs):
+        super().__init__(oauth, **kwargs)
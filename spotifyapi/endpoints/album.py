@@ -4,16 +4,17 @@ from requests_oauthlib import OAuth2Session
 
 from .base import EndpointBase
 from ..models import Album, FullAlbum, SimplifiedTrack
-from ..utils import generate
+from ..utils import generate, map_chunks
 
 
 class AlbumEndpoint(EndpointBase):
     """Endpoints for retrieving information about one or more albums from the Spotify catalog."""
 
-    def __init__(self, oauth: OAuth2Session):
-        super().__init__(oauth)
+    def __init__(self, oauth: OAuth2Session, **kwargs):
+        super().__init__(oauth, **kwargs)
 
         self._albums = f"{self._base_url}/albums"
+        self._album_loader = self._batch_loader(self.__load_albums, 20)
 
     def get_album(self, id: str) -> FullAlbum:
         """Get Spotify catalog information for a single album.
@@ -24,20 +25,32 @@ class AlbumEndpoint(EndpointBase):
         Returns:
             The album with specified ID.
         """
-        response = self._get(f"{self._albums}/{id}")
+        if self._album_loader:
+            response = self._album_loader.load(id)
+        else:
+            response = self._get(f"{self._albums}/{id}")
 
-        return FullAlbum(response.json())
+        return self._build(FullAlbum, response)
 
     def get_album_tracks(
-        self, album: Album, limit: Optional[int] = None, offset: Optional[int] = None
+        self,
+        album: Album,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
     ) -> Generator[SimplifiedTrack, None, None]:
         """Get Spotify catalog information about an album’s tracks. Optional parameters can be used to limit the number
             of tracks returned.
 
         Args:
             album: The Album object.
-            limit: The maximum number of tracks to return. Minimum: 1. Maximum: 50.
+            limit: The maximum number of tracks to return. Default: 50. Minimum: 1. Maximum: 50.
             offset: The index of the first track to return. Use with limit to get the next set of tracks.
+            workers: If given, fetch the remaining pages concurrently with at most this many workers. Default: one
+                page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
 
         Returns:
             A generator of simplified tracks.
@@ -49,11 +62,13 @@ class AlbumEndpoint(EndpointBase):
         if offset and not limit:
             raise ValueError("limit must be used with offset")
 
-        params = {"limit": limit, "offset": offset}
+        params = {"limit": limit or 50, "offset": offset}
 
         response = self._get(f"{self._albums}/{album.id}/tracks", params=params)
 
-        return generate(response.json(), SimplifiedTrack, self._oauth)
+        return generate(
+            response, SimplifiedTrack, self._get, workers, prefetch, raw=self._raw
+        )
 
     def get_albums(self, ids: List[str]) -> List[Optional[FullAlbum]]:
         """Get Spotify catalog information for multiple albums identified by their Spotify IDs.
@@ -71,4 +86,29 @@ class AlbumEndpoint(EndpointBase):
 
         response = self._get(f"{self._albums}", params=params)
 
-        return [FullAlbum(data) if data else None for data in response.json()["albums"]]
+        return [
+            self._build(FullAlbum, data) if data else None
+            for data in response["albums"]
+        ]
+
+    def get_albums_bulk(
+        self, ids: List[str], workers: int = 4
+    ) -> List[Optional[FullAlbum]]:
+        """Get Spotify catalog information for any number of albums identified by their Spotify IDs. The IDs are split
+        into requests of 20 that are sent concurrently.
+
+        Args:
+            ids: A list of the Spotify IDs for the albums.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            List of albums for IDs, in the same order. IDs not corresponding to an album give None.
+        """
+        return map_chunks(self.get_albums, ids, 20, workers)
+
+    def __load_albums(self, ids: List[str]) -> List[Optional[dict]]:
+        params = {"ids": ",".join(ids)}
+
+        response = self._get(f"{self._albums}", params=params)
+
+        return response["albums"]
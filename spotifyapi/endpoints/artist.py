@@ -4,16 +4,17 @@ from requests_oauthlib import OAuth2Session
 
 from .base import EndpointBase
 from ..models import Artist, FullArtist, FullTrack, SimplifiedAlbum
-from ..utils import generate
+from ..utils import generate, map_chunks
 
 
 class ArtistEndpoint(EndpointBase):
     """Endpoints for retrieving information about one or more artists from the Spotify catalog."""
 
-    def __init__(self, oauth: OAuth2Session):
-        super().__init__(oauth)
+    def __init__(self, oauth: OAuth2Session, **kwargs):
+        super().__init__(oauth, **kwargs)
 
         self._artists = f"{self._base_url}/artists"
+        self._artist_loader = self._batch_loader(self.__load_artists, 50)
 
     def get_artist(self, id: str) -> FullArtist:
         """Get Spotify catalog information for a single artist.
@@ -24,9 +25,12 @@ class ArtistEndpoint(EndpointBase):
         Returns:
             The artist with the specified ID.
         """
-        response = self._get(f"{self._artists}/{id}")
+        if self._artist_loader:
+            response = self._artist_loader.load(id)
+        else:
+            response = self._get(f"{self._artists}/{id}")
 
-        return FullArtist(response.json())
+        return self._build(FullArtist, response)
 
     def get_artist_albums(
         self,
@@ -35,6 +39,8 @@ class ArtistEndpoint(EndpointBase):
         country: Optional[str] = "US",
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
     ) -> Generator[SimplifiedAlbum, None, None]:
         """Get Spotify catalog information about an artist’s albums.
 
@@ -51,9 +57,13 @@ class ArtistEndpoint(EndpointBase):
                 Supply this parameter to limit the response to one particular geographical market. For example, for
                 albums available in Sweden: country=SE. If not given, results will be returned for all countries and you
                 are likely to get duplicate results per album, one for each country in which the album is available!
-            limit: The number of album objects to return. Default: 20. Minimum: 1. Maximum: 50. For example: limit=2
+            limit: The number of album objects to return. Default: 50. Minimum: 1. Maximum: 50. For example: limit=2
             offset: The index of the first album to return. Default: 0 (i.e., the first album). Use with limit to get
                 the next set of albums.
+            workers: If given, fetch the remaining pages concurrently with at most this many workers. Default: one
+                page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
         Returns:
             A generator of the artist's albums.
         """
@@ -64,14 +74,16 @@ class ArtistEndpoint(EndpointBase):
         if offset and not limit:
             raise ValueError("limit must be used with offset")
 
-        params = {"country": country, "limit": limit, "offset": offset}
+        params = {"country": country, "limit": limit or 50, "offset": offset}
 
         if include_groups:
             params["include_groups"] = ",".join(include_groups)
 
         response = self._get(f"{self._artists}/{artist.id}/albums", params=params)
 
-        return generate(response.json(), SimplifiedAlbum, self._oauth)
+        return generate(
+            response, SimplifiedAlbum, self._get, workers, prefetch, raw=self._raw
+        )
 
     def get_artist_top_tracks(
         self, artist: Artist, country: str = "US"
@@ -92,7 +104,7 @@ class ArtistEndpoint(EndpointBase):
 
         response = self._get(f"{self._artists}/{artist.id}/top-tracks", params=params)
 
-        return [FullTrack(track) for track in response.json()["tracks"]]
+        return [self._build(FullTrack, track) for track in response["tracks"]]
 
     def get_related_artists(self, artist: Artist) -> List[FullArtist]:
         """Get Spotify catalog information about artists similar to a given artist. Similarity is based on analysis of
@@ -106,7 +118,7 @@ class ArtistEndpoint(EndpointBase):
         """
         response = self._get(f"{self._artists}/{artist.id}/related-artists")
 
-        return [FullArtist(artist) for artist in response.json()["artists"]]
+        return [self._build(FullArtist, artist) for artist in response["artists"]]
 
     def get_artists(self, ids: List[str]) -> List[FullArtist]:
         """Get Spotify catalog information for several artists
@@ -124,4 +136,24 @@ class ArtistEndpoint(EndpointBase):
 
         response = self._get(f"{self._artists}", params=params)
 
-        return [FullArtist(artist) for artist in response.json()["artists"]]
+        return [self._build(FullArtist, artist) for artist in response["artists"]]
+
+    def get_artists_bulk(self, ids: List[str], workers: int = 4) -> List[FullArtist]:
+        """Get Spotify catalog information for any number of artists. The IDs are split into requests of 50 that are
+        sent concurrently.
+
+        Args:
+            ids: The Spotify IDs for the artists.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            Information on the artists, in the same order.
+        """
+        return map_chunks(self.get_artists, ids, 50, workers)
+
+    def __load_artists(self, ids: List[str]) -> List[Optional[dict]]:
+        params = {"ids": ",".join(ids)}
+
+        response = self._get(f"{self._artists}", params=params)
+
+        return response["artists"]
@@ -1,52 +1,242 @@
 """Provide the endpoint superclass."""
-import json
 import requests
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple, Union
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
 
 from ..exceptions import ExpiredTokenError, SpotifyAPIError
+from ..utils.batch import BatchLoader
+from ..utils.cache import ETagCache, SQLiteCache, cache_key
+from ..utils.codec import Codec, default_codec
+from ..utils.retry import RetryPolicy
+from ..utils.scheduler import RequestScheduler
+from ..utils.token import TokenManager
 
 
 class EndpointBase:
-    """Base endpoint functionality."""
+    """Base endpoint functionality.
 
-    def __init__(self, oauth: OAuth2Session):
+    Identical GET requests made at the same time from several threads share one network call and its decoded body.
+
+    An endpoint may be shared by many threads, and so may its session. If the session has an auto_refresh_url, its
+    token is refreshed shortly before it expires by a single thread while the others wait for the new token, see
+    TokenManager. Set pool_maxsize to the number of threads so each of them can keep a connection open.
+
+    The session is never closed behind the back of other endpoints and threads that share it. Close it with close, or
+    use the endpoint as a context manager, once it is no longer needed.
+
+    Args:
+        oauth: The session used to send requests.
+        scheduler: The scheduler every request and paging fetch goes through. Pass the same scheduler to several
+            endpoints to share one rate limit between them. Default: a scheduler that only honors Retry-After.
+        retry: The policy for retrying connection errors, timeouts and 5xx responses. GET, PUT and DELETE requests
+            are retried automatically, POST requests only when the caller opts in. Default: RetryPolicy().
+        cache: If given, the cache GET responses are kept in, such as an ETagCache or a SQLiteCache. Cached responses
+            are used as is while fresh and revalidated with If-None-Match otherwise. It may be shared with other
+            endpoints.
+        batch_window: If given, get_track, get_album, get_artist and get_audio_features for a single track wait this
+            many seconds for identical calls from other threads and send them together through the endpoint for
+            several objects.
+        codec: The codec request bodies are encoded and response bodies decoded with, including paging fetches.
+            Default: an OrjsonCodec if orjson is installed, otherwise a JSONCodec.
+        raw: If true, methods return and generators yield the decoded JSON of the API, such as dicts and lists of
+            dicts, instead of models. Arguments are still models. Responses may be shared with a cache and with other
+            callers, so they must not be modified.
+        timeout: The timeout, in seconds, of every request, either one for both connecting and reading or a (connect,
+            read) tuple. None waits forever. Default: DEFAULT_TIMEOUT.
+        pool_maxsize: If given, the maximum number of connections the session keeps open to each host. This replaces
+            the adapters of the session, so it applies to everything that shares the session and should only be set by
+            one endpoint.
+        pool_block: Whether requests wait for a free connection once pool_maxsize connections are in use, rather than
+            opening a connection that is not kept. Only used with pool_maxsize.
+        token_manager: The manager that refreshes the token of the session ahead of requests. Pass one with a store
+            to share the token with other processes, or with background to refresh it before requests need it. It may
+            be shared with other endpoints using the same session. Default: TokenManager(oauth).
+    """
+
+    # Connect quickly or fail over to a retry, but give large responses time to arrive
+    DEFAULT_TIMEOUT = (5.0, 30.0)
+
+    def __init__(
+        self,
+        oauth: OAuth2Session,
+        scheduler: Optional[RequestScheduler] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[Union[ETagCache, SQLiteCache]] = None,
+        batch_window: Optional[float] = None,
+        codec: Optional[Codec] = None,
+        raw: bool = False,
+        timeout: Optional[Union[float, Tuple[float, float]]] = DEFAULT_TIMEOUT,
+        pool_maxsize: Optional[int] = None,
+        pool_block: bool = False,
+        token_manager: Optional[TokenManager] = None,
+    ):
         self._oauth = oauth
         self._base_url = "https://api.spotify.com/v1"
+        self._scheduler = scheduler if scheduler else RequestScheduler()
+        self._retry = retry if retry else RetryPolicy()
+        self._cache = cache
+        self._batch_window = batch_window
+        self._codec = codec if codec else default_codec()
+        self._raw = raw
+        self._timeout = timeout
+        self._token_manager = token_manager if token_manager else TokenManager(oauth)
 
-    def __del__(self):
+        if pool_maxsize is not None:
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize, pool_block=pool_block)
+            self._oauth.mount("https://", adapter)
+            self._oauth.mount("http://", adapter)
+
+        # GET requests currently being sent by cache key, so identical ones can wait for them instead
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Close the connections of the session. Endpoints sharing the session will open new ones if they are used
+        again."""
         self._oauth.close()
 
-    def _delete(self, url: str, **kwargs) -> requests.models.Response:
+    def _build(self, object_factory: Callable[..., Any], data: Any, *args) -> Any:
+        # Skip building the model entirely in raw mode
+        return data if self._raw else object_factory(data, *args)
+
+    def _batch_loader(
+        self, load_many: Callable[[List[str]], List[Any]], max_size: int
+    ) -> Optional[BatchLoader]:
+        if self._batch_window is None:
+            return None
+
+        return BatchLoader(load_many, max_size, self._batch_window)
+
+    def _delete(self, url: str, **kwargs) -> Any:
         return self.__request(self._oauth.delete, url, **kwargs)
 
-    def _get(self, url: str, **kwargs) -> requests.models.Response:
-        return self.__request(self._oauth.get, url, **kwargs)
+    def _get(self, url: str, **kwargs) -> Any:
+        key = cache_key(url, kwargs.get("params"))
 
-    def _put(self, url: str, **kwargs) -> requests.models.Response:
-        return self.__request(self._oauth.put, url, **kwargs)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+
+            if leader:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            data = self.__get(url, key, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def __get(self, url: str, key: str, **kwargs) -> Any:
+        if self._cache is None:
+            return self.__request(self._oauth.get, url, **kwargs)
 
-    def _post(self, url: str, **kwargs) -> requests.models.Response:
-        return self.__request(self._oauth.post, url, **kwargs)
+        cached = self._cache.get(key)
 
-    def __request(
-        self, method, url: str, **kwargs
-    ) -> Optional[requests.models.Response]:
-        # Serialize data to json
-        if "data" in kwargs:
-            kwargs["data"] = json.dumps(kwargs["data"])
+        if cached and cached.fresh:
+            return cached.data
 
-        response = method(url, **kwargs)
+        if cached and cached.etag:
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "If-None-Match": cached.etag,
+            }
 
-        # Check if there's no content so we don't try to create an instance of something
-        if response.status_code == requests.codes.no_content:
+        response = self.__send(self._oauth.get, url, **kwargs)
+        etag = response.headers.get("ETag")
+
+        # The body hasn't changed since it was cached, so skip downloading and parsing it again
+        if cached and response.status_code == requests.codes.not_modified:
+            data, etag = cached.data, etag or cached.etag
+        else:
+            data = self.__decode(response)
+
+        if data is not None:
+            self._cache.set(key, etag, data)
+
+        return data
+
+    def _get_content(self, url: str, **kwargs) -> bytes:
+        # The body is returned undecoded, so it is neither cached nor shared with identical requests
+        return self.__send(self._oauth.get, url, **kwargs).content
+
+    def _put(self, url: str, **kwargs) -> Any:
+        return self.__request(self._oauth.put, url, **kwargs)
+
+    def _post(self, url: str, retry: bool = False, **kwargs) -> Any:
+        # POST requests are not idempotent, so they are only retried if the caller says it is safe
+        return self.__request(self._oauth.post, url, retry=retry, **kwargs)
+
+    def __request(self, method, url: str, **kwargs) -> Any:
+        return self.__decode(self.__send(method, url, **kwargs))
+
+    def __decode(self, response: requests.models.Response) -> Any:
+        # Check if there's no content so we don't try to create an instance of something. Besides 204, the API answers
+        # some calls, such as saving tracks or uploading a playlist cover, with a 200 or 202 and an empty body.
+        if (
+            response.status_code == requests.codes.no_content
+            or not response.content.strip()
+        ):
             return None
 
+        return self._codec.loads(response.content)
+
+    def __send(
+        self, method, url: str, retry: bool = True, **kwargs
+    ) -> requests.models.Response:
+        # Serialize data to json, unless it is already an encoded payload such as an image
+        if "data" in kwargs and not isinstance(kwargs["data"], bytes):
+            kwargs["data"] = self._codec.dumps(kwargs["data"])
+
+        kwargs.setdefault("timeout", self._timeout)
+
+        def send(url: str, **kwargs) -> requests.models.Response:
+            # Check the token on every attempt, since it may have expired while waiting for the scheduler or a retry
+            self._token_manager.ensure()
+
+            return method(url, **kwargs)
+
+        if retry:
+            response = self._retry.call(
+                lambda: self._scheduler.send(send, url, **kwargs)
+            )
+        else:
+            response = self._scheduler.send(send, url, **kwargs)
+
         try:
             response.raise_for_status()
-        except requests.exceptions.HTTPError:
-            if "token expired" in response.json()["error"]["message"]:
-                raise ExpiredTokenError(self._oauth.token.access_token)
-            raise SpotifyAPIError(response.json()["error"]["message"])
+        except requests.exceptions.HTTPError as e:
+            try:
+                data = self._codec.loads(response.content)
+            except ValueError:
+                # Gateway errors such as 502 do not always come with a JSON body
+                data = None
+
+            error = data.get("error") if isinstance(data, dict) else None
+            message = error.get("message") if isinstance(error, dict) else None
+
+            if not message:
+                raise SpotifyAPIError(str(e), response.status_code)
+
+            if "token expired" in message:
+                raise ExpiredTokenError(self._oauth.access_token)
+            raise SpotifyAPIError(message, response.status_code)
 
         return response
@@ -6,7 +6,7 @@ from .base import EndpointBase
 from ..authorization.decorators import scope
 from ..authorization.scopes import user_library_read, user_library_modify
 from ..models import Album, SavedAlbum, SavedTrack, Track
-from ..utils import generate
+from ..utils import generate, map_chunks
 
 
 class LibraryEndpoint(EndpointBase):
@@ -15,8 +15,8 @@ class LibraryEndpoint(EndpointBase):
     Music” library.
     """
 
-    def __init__(self, oauth: OAuth2Session):
-        super().__init__(oauth)
+    def __init__(self, oauth: OAuth2Session, **kwargs):
+        super().__init__(oauth, **kwargs)
 
         self._library = f"{self._base_url}/me"
 
@@ -46,7 +46,7 @@ class LibraryEndpoint(EndpointBase):
 
         response = self._get(f"{self._library}/albums/contains", params=params)
 
-        return response.json()[0] if len(response.json()) == 1 else response.json()
+        return response[0] if len(response) == 1 else response
 
     @scope(user_library_read)
     def is_track_saved(
@@ -74,18 +74,46 @@ class LibraryEndpoint(EndpointBase):
 
         response = self._get(f"{self._library}/tracks/contains", params=params)
 
-        return response.json()[0] if len(response.json()) == 1 else response.json()
+        return response[0] if len(response) == 1 else response
+
+    @scope(user_library_read)
+    def is_track_saved_bulk(self, tracks: List[Track], workers: int = 4) -> List[bool]:
+        """Check if any number of tracks are already saved in the current Spotify user’s ‘Your Music’ library. The
+        tracks are split into requests of 50 that are sent concurrently.
+
+        Args:
+            tracks: The tracks to check.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            A list of True/False for the tracks, in the same order.
+        """
+
+        def contains(chunk: List[Track]) -> List[bool]:
+            params = {"ids": ",".join([track.id for track in chunk])}
+
+            return self._get(f"{self._library}/tracks/contains", params=params)
+
+        return map_chunks(contains, tracks, 50, workers)
 
     @scope(user_library_read)
     def get_saved_albums(
-        self, limit: Optional[int] = None, offset: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
     ) -> Generator[SavedAlbum, None, None]:
         """Get a list of the albums saved in the current Spotify user’s ‘Your Music’ library.
 
         Args:
-            limit: The maximum number of objects to return. Default: 20. Minimum: 1. Maximum: 50.
+            limit: The maximum number of objects to return. Default: 50. Minimum: 1. Maximum: 50.
             offset: The index of the first object to return. Default: 0 (i.e., the first object). Use with limit to get
                 the next set of objects.
+            workers: If given, fetch the remaining pages concurrently with at most this many workers. Default: one
+                page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
 
         Raises:
             ValueError:
@@ -101,22 +129,32 @@ class LibraryEndpoint(EndpointBase):
         if offset and not limit:
             raise ValueError("limit must be used with offset")
 
-        params = {"limit": limit, "offset": offset}
+        params = {"limit": limit or 50, "offset": offset}
 
         response = self._get(f"{self._library}/albums", params=params)
 
-        return generate(response.json(), SavedAlbum, self._oauth)
+        return generate(
+            response, SavedAlbum, self._get, workers, prefetch, raw=self._raw
+        )
 
     @scope(user_library_read)
     def get_saved_tracks(
-        self, limit: Optional[int] = None, offset: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
     ) -> Generator[SavedTrack, None, None]:
         """Get a list of the songs saved in the current Spotify user’s ‘Your Music’ library.
 
         Args:
-            limit: The maximum number of objects to return. Default: 20. Minimum: 1. Maximum: 50.
+            limit: The maximum number of objects to return. Default: 50. Minimum: 1. Maximum: 50.
             offset: The index of the first object to return. Default: 0 (i.e., the first object). Use with limit to get
                 the next set of objects.
+            workers: If given, fetch the remaining pages concurrently with at most this many workers. Default: one
+                page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
 
         Raises:
             ValueError:
@@ -132,11 +170,13 @@ class LibraryEndpoint(EndpointBase):
         if offset and not limit:
             raise ValueError("limit must be used with offset")
 
-        params = {"limit": limit, "offset": offset}
+        params = {"limit": limit or 50, "offset": offset}
 
         response = self._get(f"{self._library}/tracks", params=params)
 
-        return generate(response.json(), SavedTrack, self._oauth)
+        return generate(
+            response, SavedTrack, self._get, workers, prefetch, raw=self._raw
+        )
 
     @scope(user_library_modify)
     def remove_saved_albums(self, albums: Union[Album, List[Album]]):
@@ -184,6 +224,19 @@ class LibraryEndpoint(EndpointBase):
 
         self._delete(f"{self._library}/tracks", params=params)
 
+    @scope(user_library_modify)
+    def remove_saved_tracks_bulk(self, tracks: List[Track], workers: int = 4):
+        """Remove any number of tracks from the current user’s ‘Your Music’ library. The tracks are split into requests
+        of 50 that are sent concurrently.
+
+        Changes to a user’s saved tracks may not be visible in other Spotify applications immediately.
+
+        Args:
+            tracks: The tracks to be removed.
+            workers: The maximum number of requests sent at once.
+        """
+        map_chunks(self.remove_saved_tracks, tracks, 50, workers)
+
     @scope(user_library_modify)
     def save_albums(self, albums: Union[Album, List[Album]]):
         """Save one or more albums to the current user’s ‘Your Music’ library.
@@ -225,3 +278,14 @@ class LibraryEndpoint(EndpointBase):
             params = {"ids": tracks.id}
 
         self._put(f"{self._library}/tracks", params=params)
+
+    @scope(user_library_modify)
+    def save_tracks_bulk(self, tracks: List[Track], workers: int = 4):
+        """Save any number of tracks to the current user’s ‘Your Music’ library. The tracks are split into requests of
+        50 that are sent concurrently.
+
+        Args:
+            tracks: The tracks to save.
+            workers: The maximum number of requests sent at once.
+        """
+        map_chunks(self.save_tracks, tracks, 50, workers)
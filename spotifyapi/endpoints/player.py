@@ -17,8 +17,8 @@ from ..utils import generate
 class PlayerEndpoint(EndpointBase):
     """Retrieve and modify the user's playback."""
 
-    def __init__(self, oauth: OAuth2Session):
-        super().__init__(oauth)
+    def __init__(self, oauth: OAuth2Session, **kwargs):
+        super().__init__(oauth, **kwargs)
 
         self._player = f"{self._base_url}/me/player"
 
@@ -30,7 +30,7 @@ class PlayerEndpoint(EndpointBase):
         """
         response = self._get(f"{self._player}/devices")
 
-        return [Device(data) for data in response.json()["devices"]]
+        return [self._build(Device, data) for data in response["devices"]]
 
     @scope(user_read_playback_state)
     def get_playback(self) -> Optional[CurrentlyPlayingContext]:
@@ -45,7 +45,7 @@ class PlayerEndpoint(EndpointBase):
         response = self._get(f"{self._player}")
 
         if response:
-            return CurrentlyPlayingContext(response.json())
+            return self._build(CurrentlyPlayingContext, response)
 
     @scope(user_read_recently_played)
     def get_recently_played_tracks(
@@ -53,15 +53,18 @@ class PlayerEndpoint(EndpointBase):
         limit: Optional[int] = None,
         after: Optional[str] = None,
         before: Optional[str] = None,
+        prefetch: Optional[int] = None,
     ) -> Generator[PlayHistory, None, None]:
         """Get tracks from the current user’s recently played tracks.
 
         Args:
-            limit: The maximum number of items to return. Default: 20. Minimum: 1. Maximum: 50.
+            limit: The maximum number of items to return. Default: 50. Minimum: 1. Maximum: 50.
             after: A Unix timestamp in milliseconds. Returns all items after (but not including) this cursor position.
                 If after is specified, before must not be specified.
             before: A Unix timestamp in milliseconds. Returns all items before (but not including) this cursor position.
                 If before is specified, after must not be specified.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
 
         Raises:
             ValueError:
@@ -79,11 +82,13 @@ class PlayerEndpoint(EndpointBase):
         if after and before:
             raise ValueError("Can only specify after or before, not both")
 
-        params = {"limit": limit, "after": after, "before": before}
+        params = {"limit": limit or 50, "after": after, "before": before}
 
         response = self._get(f"{self._player}/recently-played", params=params)
 
-        return generate(response.json(), PlayHistory, self._oauth)
+        return generate(
+            response, PlayHistory, self._get, prefetch=prefetch, raw=self._raw
+        )
 
     @scope(user_read_currently_playing, user_read_playback_state)
     def get_currently_playing(self) -> Optional[CurrentlyPlaying]:
@@ -99,7 +104,7 @@ class PlayerEndpoint(EndpointBase):
         response = self._get(f"{self._player}/currently-playing")
 
         if response:
-            return CurrentlyPlaying(response.json())
+            return self._build(CurrentlyPlaying, response)
 
     @scope(user_modify_playback_state)
     def pause(self, device: Optional[Device] = None) -> None:
@@ -28,8 +28,8 @@ from ..utils import generate
 class PlaylistEndpoint(EndpointBase):
     """Endpoints for retrieving information about a user’s playlists and for managing a user’s playlists."""
 
-    def __init__(self, oauth: OAuth2Session):
-        super().__init__(oauth)
+    def __init__(self, oauth: OAuth2Session, **kwargs):
+        super().__init__(oauth, **kwargs)
 
     @scope(playlist_modify_public, playlist_modify_private)
     def add_playlist_tracks(
@@ -37,6 +37,7 @@ class PlaylistEndpoint(EndpointBase):
         playlist: Playlist,
         tracks: Union[Track, List[Track]],
         position: Optional[int] = None,
+        retry: bool = False,
     ) -> str:
         """Add one or more tracks to a user’s playlist.
 
@@ -47,6 +48,8 @@ class PlaylistEndpoint(EndpointBase):
                 first position: position=0; to insert the tracks in the third position: position=2 . If omitted, the
                 tracks will be appended to the playlist. Tracks are added in the order they are listed in the query
                 string or request body.
+            retry: Whether to retry the request if it fails for a transient reason. Adding tracks is not idempotent, so
+                a retry may add the tracks twice if the first attempt reached Spotify.
 
         Returns:
             The snapshot_id that can be used to identify your playlist version in future requests.
@@ -65,10 +68,44 @@ class PlaylistEndpoint(EndpointBase):
             data["uris"] = [track.uri for track in tracks]
 
         response = self._post(
-            f"{self._base_url}/playlists/{playlist.id}/tracks", data=data
+            f"{self._base_url}/playlists/{playlist.id}/tracks", data=data, retry=retry
         )
 
-        return response.json()["snapshot_id"]
+        return response["snapshot_id"]
+
+    @scope(playlist_modify_public, playlist_modify_private)
+    def add_playlist_tracks_bulk(
+        self,
+        playlist: Playlist,
+        tracks: List[Track],
+        position: Optional[int] = None,
+        retry: bool = False,
+    ) -> Optional[str]:
+        """Add any number of tracks to a user’s playlist. The tracks are split into requests of 100, which are sent one
+        after the other so the tracks keep their order in the playlist.
+
+        Args:
+            playlist: The playlist to add to.
+            tracks: The tracks to add.
+            position: The position to insert the tracks, a zero-based index. If omitted, the tracks will be appended
+                to the playlist.
+            retry: Whether to retry requests that fail for a transient reason. Adding tracks is not idempotent, so a
+                retry may add tracks twice if the first attempt reached Spotify.
+
+        Returns:
+            The snapshot_id of the playlist after the last request, or None if no tracks are given.
+        """
+        snapshot_id = None
+
+        for i in range(0, len(tracks), 100):
+            chunk = tracks[i : i + 100]
+            chunk_position = None if position is None else position + i
+
+            snapshot_id = self.add_playlist_tracks(
+                playlist, chunk, chunk_position, retry
+            )
+
+        return snapshot_id
 
     @scope(playlist_modify_public, playlist_modify_private)
     def change_playlist_details(
@@ -117,6 +154,7 @@ class PlaylistEndpoint(EndpointBase):
         public: Optional[bool] = True,
         collaborative: Optional[bool] = False,
         description: Optional[str] = None,
+        retry: bool = False,
     ) -> FullPlaylist:
         """Create a playlist for a Spotify user. (The playlist will be empty until you add tracks.)
 
@@ -129,6 +167,8 @@ class PlaylistEndpoint(EndpointBase):
                 collaborative playlist you must also set public to false . To create collaborative playlists you must
                 have granted playlist-modify-private and playlist-modify-public scopes.
             description: value for playlist description as displayed in Spotify Clients and in the Web API.
+            retry: Whether to retry the request if it fails for a transient reason. Creating a playlist is not
+                idempotent, so a retry may create it twice if the first attempt reached Spotify.
 
         Returns:
             The playlist just created.
@@ -142,7 +182,7 @@ class PlaylistEndpoint(EndpointBase):
         # Get the current user, apparently the Spotify API doesn't do that for you?
         response = self._get(f"{self._base_url}/me")
 
-        me = PrivateUser(response.json())
+        me = PrivateUser(response)
 
         data = {
             "name": name,
@@ -151,20 +191,30 @@ class PlaylistEndpoint(EndpointBase):
             "description": description,
         }
 
-        response = self._post(f"{self._base_url}/users/{me.id}/playlists", data=data)
+        response = self._post(
+            f"{self._base_url}/users/{me.id}/playlists", data=data, retry=retry
+        )
 
-        return FullPlaylist(response.json(), self._oauth)
+        return self._build(FullPlaylist, response, self._get)
 
     @scope(playlist_read_private)
     def get_current_playlists(
-        self, limit: Optional[int] = None, offset: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
     ) -> Generator[SimplifiedPlaylist, None, None]:
         """Get a generator of the playlists owned or followed by the current Spotify user.
 
         Args:
-            limit: The maximum number of playlists to return. Default: 20. Minimum: 1. Maximum: 50.
+            limit: The maximum number of playlists to return. Default: 50. Minimum: 1. Maximum: 50.
             offset: The index of the first playlist to return. Default: 0 (the first object). Maximum offset: 100,000.
                 Use with limit to get the next set of playlists.
+            workers: If given, fetch the remaining pages concurrently with at most this many workers. Default: one
+                page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
 
         Returns:
             A generator of the user's playlists.
@@ -181,23 +231,34 @@ class PlaylistEndpoint(EndpointBase):
         if offset and offset > 100_000:
             raise ValueError("offset must be 100,000 or below")
 
-        params = {"limit": limit, "offset": offset}
+        params = {"limit": limit or 50, "offset": offset}
 
         response = self._get(f"{self._base_url}/me/playlists", params=params)
 
-        return generate(response.json(), SimplifiedPlaylist, self._oauth)
+        return generate(
+            response, SimplifiedPlaylist, self._get, workers, prefetch, raw=self._raw
+        )
 
     @scope(playlist_modify_private, playlist_read_collaborative)
     def get_users_playlists(
-        self, user: User, limit: Optional[int] = None, offset: Optional[int] = None
+        self,
+        user: User,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
     ) -> Generator[SimplifiedPlaylist, None, None]:
         """Get a generator of the playlists owned or followed by a Spotify user.
 
         Args:
             user: The user to get playlists from.
-            limit: The maximum number of playlists to return. Default: 20. Minimum: 1. Maximum: 50.
+            limit: The maximum number of playlists to return. Default: 50. Minimum: 1. Maximum: 50.
             offset: The index of the first playlist to return. Default: 0 (the first object). Maximum offset: 100,000.
                 Use with limit to get the next set of playlists.
+            workers: If given, fetch the remaining pages concurrently with at most this many workers. Default: one
+                page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
 
         Returns:
             A generator of the user's playlists.
@@ -214,13 +275,15 @@ class PlaylistEndpoint(EndpointBase):
         if offset and offset > 100_000:
             raise ValueError("offset must be 100,000 or below")
 
-        params = {"limit": limit, "offset": offset}
+        params = {"limit": limit or 50, "offset": offset}
 
         response = self._get(
             f"{self._base_url}/users/{user.id}/playlists", params=params
         )
 
-        return generate(response.json(), SimplifiedPlaylist, self._oauth)
+        return generate(
+            response, SimplifiedPlaylist, self._get, workers, prefetch, raw=self._raw
+        )
 
     def get_playlist_cover_image(self, playlist: Playlist) -> Union[Image, List[Image]]:
         """Get the current image(s) associated with a specific playlist.
@@ -233,7 +296,7 @@ class PlaylistEndpoint(EndpointBase):
         """
         response = self._get(f"{self._base_url}/playlists/{playlist.id}/images")
 
-        images = [Image(data) for data in response.json()]
+        images = [self._build(Image, data) for data in response]
 
         if len(images) == 1:
             return images[0]
@@ -251,37 +314,49 @@ class PlaylistEndpoint(EndpointBase):
         """
         response = self._get(f"{self._base_url}/playlists/{id}")
 
-        return FullPlaylist(response.json(), self._oauth)
+        return self._build(FullPlaylist, response, self._get)
 
     def get_playlist_tracks(
         self,
         playlist: Playlist,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        workers: Optional[int] = None,
+        prefetch: Optional[int] = None,
     ) -> Generator[PlaylistTrack, None, None]:
         """Get full details of the tracks of a playlist owned by a Spotify user.
 
         Args:
             playlist: The playlist to get tracks for.
-            limit: The maximum number of playlists to return. Default: 20. Minimum: 1. Maximum: 50.
-            offset: The index of the first playlist to return. Default: 0 (the first object). Use with limit to get the
-                next set of playlists.
+            limit: The maximum number of tracks to return. Default: 100. Minimum: 1. Maximum: 100.
+            offset: The index of the first track to return. Default: 0 (the first object). Use with limit to get the
+                next set of tracks.
+            workers: If given, fetch the remaining pages concurrently with at most this many workers. Default: one
+                page at a time.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is
+                consumed.
 
         Returns:
             A generator of the playlist's tracks.
 
         Raises:
-            ValueError: If limit is outside [1, 50]. If offset is used without limit.
+            ValueError: If limit is outside [1, 100]. If offset is used without limit.
         """
-        if limit and not 1 <= limit <= 50:
-            raise ValueError("limit must be between 1 and 50")
+        if limit and not 1 <= limit <= 100:
+            raise ValueError("limit must be between 1 and 100")
 
         if offset and not limit:
             raise ValueError("limit must be used with offset")
 
-        response = self._get(f"{self._base_url}/playlists/{playlist.id}/tracks")
+        params = {"limit": limit or 100, "offset": offset}
 
-        return generate(response.json(), PlaylistTrack, self._oauth)
+        response = self._get(
+            f"{self._base_url}/playlists/{playlist.id}/tracks", params=params
+        )
+
+        return generate(
+            response, PlaylistTrack, self._get, workers, prefetch, raw=self._raw
+        )
 
     @scope(playlist_modify_public, playlist_modify_private)
     def remove_playlist_tracks(
@@ -313,7 +388,7 @@ class PlaylistEndpoint(EndpointBase):
             f"{self._base_url}/playlists/{playlist.id}/tracks", data=data
         )
 
-        return response.json()["snapshot_id"]
+        return response["snapshot_id"]
 
     @scope(playlist_modify_public, playlist_modify_private)
     def reorder_playlist_tracks(
@@ -351,7 +426,7 @@ class PlaylistEndpoint(EndpointBase):
             f"{self._base_url}/playlists/{playlist.id}/tracks", data=data
         )
 
-        return response.json()["snapshot_id"]
+        return response["snapshot_id"]
 
     @scope(playlist_modify_public, playlist_modify_private)
     def replace_playlist_tracks(
@@ -393,7 +468,7 @@ class PlaylistEndpoint(EndpointBase):
 
         headers = {"Content-type": "image/jpeg"}
 
-        self._oauth.put(
+        self._put(
             f"{self._base_url}/playlists/{playlist.id}/images",
             data=image_data_encoded,
             headers=headers,
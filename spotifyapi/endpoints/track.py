@@ -3,14 +3,26 @@ from typing import List, Optional, Union
 from requests_oauthlib import OAuth2Session
 
 from .base import EndpointBase
-from ..models import AudioAnalysis, AudioFeatures, FullTrack, Track
+from ..models import (
+    AudioAnalysis,
+    AudioFeatures,
+    AudioFeaturesBatch,
+    FullTrack,
+    Track,
+)
+from ..utils import map_chunks
 
 
 class TrackEndpoint(EndpointBase):
     """Endpoints for retrieving information about one or more tracks from the Spotify catalog."""
 
-    def __init__(self, oauth: OAuth2Session):
-        super().__init__(oauth)
+    def __init__(self, oauth: OAuth2Session, **kwargs):
+        super().__init__(oauth, **kwargs)
+
+        self._track_loader = self._batch_loader(self.__load_tracks, 50)
+        self._audio_features_loader = self._batch_loader(
+            self.__load_audio_features, 100
+        )
 
     def get_audio_analysis(self, track: Track) -> AudioAnalysis:
         """Get a detailed audio analysis for a single track.
@@ -24,15 +36,24 @@ class TrackEndpoint(EndpointBase):
         considered speculative. There may not be sufficient data in the audio to compute the attribute with high
         certainty.
 
+        The objects of each array of the analysis, such as its segments, are only built when the array is first used.
+        Without a cache, the arrays that are never used are not even decoded from the response body.
+
         Args:
             track: The track to get analysis for.
 
         Returns:
             Audio analysis for the track.
         """
-        response = self._get(f"{self._base_url}/audio-analysis/{track.id}")
+        url = f"{self._base_url}/audio-analysis/{track.id}"
+
+        if self._raw or self._cache is not None:
+            response = self._get(url)
 
-        return AudioAnalysis(response.json())
+            return self._build(AudioAnalysis, response)
+
+        # Nothing else needs the decoded body, so only the arrays that are used get decoded
+        return AudioAnalysis.from_json(self._get_content(url), self._codec.loads)
 
     def get_audio_features(
         self, track: Union[Track, List[Track]]
@@ -55,12 +76,52 @@ class TrackEndpoint(EndpointBase):
 
             response = self._get(f"{self._base_url}/audio-features", params=params)
 
-            return [AudioFeatures(data) for data in response.json()["audio_features"]]
+            return [
+                self._build(AudioFeatures, data) for data in response["audio_features"]
+            ]
 
         else:
-            response = self._get(f"{self._base_url}/audio-features/{track.id}")
+            if self._audio_features_loader:
+                response = self._audio_features_loader.load(track.id)
+            else:
+                response = self._get(f"{self._base_url}/audio-features/{track.id}")
+
+            return self._build(AudioFeatures, response)
+
+    def get_audio_features_bulk(
+        self, tracks: List[Track], workers: int = 4
+    ) -> List[AudioFeatures]:
+        """Get audio feature information for any number of tracks. The tracks are split into requests of 100 that are
+        sent concurrently.
+
+        Args:
+            tracks: The tracks to get audio features for.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            A list of audio features for the tracks, in the same order.
+        """
+        return map_chunks(self.get_audio_features, tracks, 100, workers)
+
+    def get_audio_features_batch(
+        self, tracks: List[Track], workers: int = 4
+    ) -> AudioFeaturesBatch:
+        """Get audio feature information for any number of tracks as columns, one array per feature, which is faster
+        to build and to scan than a list of audio features. The tracks are split into requests of 100 that are sent
+        concurrently.
+
+        Args:
+            tracks: The tracks to get audio features for.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            The audio features of the tracks, in the same order. Tracks without audio features are left out.
+        """
+        ids = [track.id for track in tracks]
 
-            return AudioFeatures(response.json())
+        return AudioFeaturesBatch(
+            map_chunks(self.__load_audio_features, ids, 100, workers)
+        )
 
     def get_track(self, id: str) -> FullTrack:
         """Get Spotify catalog information for a single track identified by its unique Spotify ID.
@@ -71,9 +132,12 @@ class TrackEndpoint(EndpointBase):
         Returns:
             A full track for the ID.
         """
-        response = self._get(f"{self._base_url}/tracks/{id}")
+        if self._track_loader:
+            response = self._track_loader.load(id)
+        else:
+            response = self._get(f"{self._base_url}/tracks/{id}")
 
-        return FullTrack(response.json())
+        return self._build(FullTrack, response)
 
     def get_tracks(self, ids: List[str]) -> List[Optional[FullTrack]]:
         """Get Spotify catalog information for multiple tracks based on their Spotify IDs.
@@ -91,4 +155,36 @@ class TrackEndpoint(EndpointBase):
 
         response = self._get(f"{self._base_url}/tracks", params=params)
 
-        return [FullTrack(data) if data else None for data in response.json()["tracks"]]
+        return [
+            self._build(FullTrack, data) if data else None
+            for data in response["tracks"]
+        ]
+
+    def get_tracks_bulk(
+        self, ids: List[str], workers: int = 4
+    ) -> List[Optional[FullTrack]]:
+        """Get Spotify catalog information for any number of tracks based on their Spotify IDs. The IDs are split into
+        requests of 50 that are sent concurrently.
+
+        Args:
+            ids: A list of the Spotify IDs for the tracks.
+            workers: The maximum number of requests sent at once.
+
+        Returns:
+            A list of full tracks for IDs, in the same order. None for IDs that do not correspond with a track.
+        """
+        return map_chunks(self.get_tracks, ids, 50, workers)
+
+    def __load_tracks(self, ids: List[str]) -> List[Optional[dict]]:
+        params = {"ids": ",".join(ids)}
+
+        response = self._get(f"{self._base_url}/tracks", params=params)
+
+        return response["tracks"]
+
+    def __load_audio_features(self, ids: List[str]) -> List[Optional[dict]]:
+        params = {"ids": ",".join(ids)}
+
+        response = self._get(f"{self._base_url}/audio-features", params=params)
+
+        return response["audio_features"]
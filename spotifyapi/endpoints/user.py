@@ -8,8 +8,8 @@ from ..models import PublicUser, PrivateUser
 class UserEndpoint(EndpointBase):
     """Endpoints for retrieving information about a user’s profile."""
 
-    def __init__(self, oauth: OAuth2Session):
-        super().__init__(oauth)
+    def __init__(self, oauth: OAuth2Session, **kwargs):
+        super().__init__(oauth, **kwargs)
 
         self._user = f"{self._base_url}"
 
@@ -21,7 +21,7 @@ class UserEndpoint(EndpointBase):
         """
         response = self._get(f"{self._user}/me")
 
-        return PrivateUser(response.json())
+        return self._build(PrivateUser, response)
 
     def get_user(self, id: str) -> PublicUser:
         """Get public profile information about a Spotify user.
@@ -34,4 +34,4 @@ class UserEndpoint(EndpointBase):
         """
         response = self._get(f"{self._user}/users/{id}")
 
-        return PublicUser(response.json())
+        return self._build(PublicUser, response)
@@ -1,4 +1,5 @@
 """Provide custom exceptions"""
+from typing import Optional
 
 
 class ExpiredTokenError(Exception):
@@ -10,4 +11,14 @@ class InvalidScopeError(Exception):
 
 
 class SpotifyAPIError(Exception):
-    """Generic error from an endpoint."""
+    """Generic error from an endpoint.
+
+    Args:
+        message: The error message.
+        status: The HTTP status of the response the error came from, if any.
+    """
+
+    def __init__(self, message: str = "", status: Optional[int] = None):
+        super().__init__(message)
+
+        self.status = status
@@ -1,7 +1,9 @@
 from .album import Album
 from .artist import Artist
-from .audio_analysis import AudioAnalysis
+from .audio_analysis import AudioAnalysis, AudioAnalysisPosition, AudioAnalysisRange
+from .audio_analysis_file import RecordArray
 from .audio_features import AudioFeatures
+from .audio_features_batch import AudioFeaturesBatch
 from .context import Context
 from .copyright import Copyright
 from .currently_playing import CurrentlyPlaying, CurrentlyPlayingContext
@@ -9,9 +11,11 @@ from .device import Device
 from .followers import Followers
 from .full_album import FullAlbum
 from .full_artist import FullArtist
-from .full_playlist import FullPlaylist
+from .full_playlist import AsyncFullPlaylist, FullPlaylist
 from .full_track import FullTrack
 from .image import Image
+from .lazy_json import LazyJSONObject
+from .lazy_list import LazyList
 from .paging import Paging
 from .play_history import PlayHistory
 from .playlist import Playlist
@@ -22,6 +26,7 @@ from .saved_album import SavedAlbum
 from .saved_track import SavedTrack
 from .section import Section
 from .segment import Segment
+from .segment_arrays import SegmentArrays
 from .simplified_album import SimplifiedAlbum
 from .simplified_artist import SimplifiedArtist
 from .simplified_playlist import SimplifiedPlaylist
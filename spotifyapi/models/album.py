@@ -2,22 +2,38 @@
 from typing import Dict, List, Optional
 
 from .image import Image
+from .lazy_list import build_list
 from .simplified_artist import SimplifiedArtist
 
 
 class Album:
     """An album."""
 
+    __slots__ = (
+        "_album_type",
+        "_artists",
+        "_available_markets",
+        "_external_urls",
+        "_href",
+        "_id",
+        "_images",
+        "_name",
+        "_release_date",
+        "_release_date_precision",
+        "_type",
+        "_uri",
+    )
+
     def __init__(self, data):
         self._album_type = data["album_type"]
-        self._artists = [SimplifiedArtist(d) for d in data["artists"]]
+        self._artists = data["artists"] or []
         self._available_markets = (
             data["available_markets"] if "available_markets" in data else None
         )
         self._external_urls = data["external_urls"]
         self._href = data["href"]
         self._id = data["id"]
-        self._images = [Image(d) for d in data["images"]]
+        self._images = data["images"] or []
         self._name = data["name"]
         self._release_date = data["release_date"]
         self._release_date_precision = data["release_date_precision"]
@@ -35,6 +51,8 @@ class Album:
         The artists of the album. Each artist object includes a link in href to more detailed information about the
         artist.
         """
+        self._artists = build_list(self._artists, SimplifiedArtist)
+
         return self._artists
 
     @property
@@ -63,6 +81,8 @@ class Album:
     @property
     def images(self) -> List[Image]:
         """The cover art for the album in various sizes, widest first."""
+        self._images = build_list(self._images, Image)
+
         return self._images
 
     @property
@@ -5,6 +5,8 @@ from typing import Dict
 class Artist:
     """An artist."""
 
+    __slots__ = ("_external_urls", "_href", "_id", "_name", "_type", "_uri")
+
     def __init__(self, data):
         self._external_urls = data["external_urls"]
         self._href = data["href"]
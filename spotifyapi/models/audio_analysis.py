@@ -1,61 +1,254 @@
 """Provide the audio analysis model."""
-from typing import List
+import json
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
 
+from . import audio_analysis_file
+from .audio_analysis_file import RecordArray
+from .lazy_json import LazyJSONObject
+from .lazy_list import LazyList
 from .section import Section
 from .segment import Segment
+from .segment_arrays import SegmentArrays
 from .time_interval import TimeInterval
 
 
+class AudioAnalysisPosition(NamedTuple):
+    """The bar, beat, section, segment and tatum playing at a point in time. Each is None if none covers the time."""
+
+    bar: Optional[TimeInterval]
+    beat: Optional[TimeInterval]
+    section: Optional[Section]
+    segment: Optional[Segment]
+    tatum: Optional[TimeInterval]
+
+
+class AudioAnalysisRange(NamedTuple):
+    """The bars, beats, sections, segments and tatums that overlap a span of time, in order."""
+
+    bars: List[TimeInterval]
+    beats: List[TimeInterval]
+    sections: List[Section]
+    segments: List[Segment]
+    tatums: List[TimeInterval]
+
+
 class AudioAnalysis:
     """
     The track’s structure and musical content, including rhythm, pitch, and timbre. All information is precise to the
     audio sample.
+
+    Each of bars, beats, sections, segments and tatums is only built from the data when it is first accessed.
     """
 
+    # The top-level keys of an audio analysis
+    KEYS = ("meta", "track", "bars", "beats", "sections", "segments", "tatums")
+
+    # The arrays of time intervals, in the order of AudioAnalysisPosition and AudioAnalysisRange
+    ARRAYS = ("bars", "beats", "sections", "segments", "tatums")
+
+    __slots__ = (
+        "_data",
+        "_bars",
+        "_beats",
+        "_sections",
+        "_segments",
+        "_tatums",
+        "_segment_arrays",
+        "_columns",
+    )
+
     def __init__(self, data):
-        self._bars = [TimeInterval(d) for d in data["bars"]]
-        self._beats = [TimeInterval(d) for d in data["beats"]]
-        self._sections = [Section(d) for d in data["sections"]]
-        self._segments = [Segment(d) for d in data["segments"]]
-        self._tatums = [TimeInterval(d) for d in data["tatums"]]
+        self._data = data
+
+        self._bars = None
+        self._beats = None
+        self._sections = None
+        self._segments = None
+        self._tatums = None
+        self._segment_arrays = None
+
+        # The start times and durations of each array, built on the first lookup by time
+        self._columns = {}
+
+    @classmethod
+    def from_json(
+        cls, content: bytes, loads: Callable[[bytes], Any] = json.loads
+    ) -> "AudioAnalysis":
+        """Build an audio analysis straight from its encoded JSON. The arrays of the analysis are found with a quick
+        scan and each of them is only decoded when it is first accessed, so arrays that are never used are never
+        turned into Python objects.
+
+        Args:
+            content: The JSON body of the audio analysis.
+            loads: Decodes JSON. Default: json.loads.
+
+        Returns:
+            The audio analysis.
+        """
+        return cls(LazyJSONObject(content, cls.KEYS, loads))
+
+    @classmethod
+    def load(cls, path: str) -> "AudioAnalysis":
+        """Open an audio analysis written by dump. The file is memory mapped and its arrays are used in place, so
+        opening it reads next to nothing and only the parts that are used are ever read from disk.
+
+        Args:
+            path: The path of the file.
+
+        Returns:
+            The audio analysis.
+
+        Raises:
+            ValueError: If the file is not an audio analysis file that can be read on this machine.
+        """
+        return cls(audio_analysis_file.load(path))
+
+    def dump(self, path: str) -> None:
+        """Write the bars, beats, sections, segments and tatums of the audio analysis to a compact binary file that
+        can be opened with load. Each field is stored as a typed array, with pitches and timbre as float32, in the byte
+        order of this machine.
+
+        Args:
+            path: The path of the file.
+        """
+        audio_analysis_file.dump(self._data, path)
 
     @property
-    def bars(self) -> List[TimeInterval]:
+    def bars(self) -> Sequence[TimeInterval]:
         """
         The time intervals of the bars throughout the track. A bar (or measure) is a segment of time defined as a given
         number of beats. Bar offsets also indicate downbeats, the first beat of the measure.
         """
+        if self._bars is None:
+            self._bars = LazyList(self._data["bars"], TimeInterval)
+
         return self._bars
 
     @property
-    def beats(self) -> List[TimeInterval]:
+    def beats(self) -> Sequence[TimeInterval]:
         """
         The time intervals of beats throughout the track. A beat is the basic time unit of a piece of music; for
         example, each tick of a metronome. Beats are typically multiples of tatums.
         """
+        if self._beats is None:
+            self._beats = LazyList(self._data["beats"], TimeInterval)
+
         return self._beats
 
     @property
-    def sections(self) -> List[Section]:
+    def sections(self) -> Sequence[Section]:
         """
         Sections are defined by large variations in rhythm or timbre, e.g. chorus, verse, bridge, guitar solo, etc. Each
         section contains its own descriptions of tempo, key, mode, time_signature, and loudness.
         """
+        if self._sections is None:
+            self._sections = LazyList(self._data["sections"], Section)
+
         return self._sections
 
     @property
-    def segments(self) -> List[Segment]:
+    def segments(self) -> Sequence[Segment]:
         """
         Audio segments attempts to subdivide a song into many segments, with each segment containing a roughly
         consistent sound throughout its duration.
         """
+        if self._segments is None:
+            self._segments = LazyList(self._data["segments"], Segment)
+
         return self._segments
 
+    def segment_arrays(self) -> SegmentArrays:
+        """Get the segments as NumPy arrays, such as an N×12 matrix of their pitches, for numerical work on a whole
+        track. The arrays are built once and shared between calls, so they must not be modified. It requires NumPy,
+        which can be installed with `pip install spotifyapi[numpy]`.
+
+        Returns:
+            The segment arrays.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if self._segment_arrays is None:
+            self._segment_arrays = SegmentArrays.from_data(self._data["segments"])
+
+        return self._segment_arrays
+
     @property
-    def tatums(self) -> List[TimeInterval]:
+    def tatums(self) -> Sequence[TimeInterval]:
         """
         A tatum represents the lowest regular pulse train that a listener intuitively infers from the timing of
         perceived musical events (segments). For more information about tatums, see
         https://developer.spotify.com/documentation/web-api/reference/tracks/get-audio-analysis/#rhythm
         """
+        if self._tatums is None:
+            self._tatums = LazyList(self._data["tatums"], TimeInterval)
+
         return self._tatums
+
+    def at(self, t: float) -> AudioAnalysisPosition:
+        """Get the bar, beat, section, segment and tatum playing at a point in time. Each lookup is a binary search, so
+        it is fast enough to call on every frame of a visualizer.
+
+        Args:
+            t: The time in seconds from the start of the track, such as CurrentlyPlaying.progress_ms / 1000.
+
+        Returns:
+            The intervals that cover the time.
+        """
+        return AudioAnalysisPosition(*(self.__at(name, t) for name in self.ARRAYS))
+
+    def range(self, t0: float, t1: float) -> AudioAnalysisRange:
+        """Get the bars, beats, sections, segments and tatums that overlap a span of time. Each lookup is a binary
+        search, followed by building only the intervals that are returned.
+
+        Args:
+            t0: The start of the span in seconds from the start of the track.
+            t1: The end of the span in seconds from the start of the track, exclusive.
+
+        Returns:
+            The intervals that overlap the span.
+        """
+        return AudioAnalysisRange(*(self.__range(name, t0, t1) for name in self.ARRAYS))
+
+    def __column(self, name: str, field: str) -> Sequence[float]:
+        column = self._columns.get((name, field))
+
+        if column is None:
+            data = self._data[name]
+
+            # Read from the data so no objects are built for the index
+            if isinstance(data, RecordArray):
+                column = data.column(field)
+            else:
+                column = [d[field] for d in data]
+
+            self._columns[(name, field)] = column
+
+        return column
+
+    def __covers(self, name: str, index: int, t: float) -> bool:
+        start = self.__column(name, "start")[index]
+
+        return start <= t < start + self.__column(name, "duration")[index]
+
+    def __at(self, name: str, t: float) -> Optional[Any]:
+        index = bisect_right(self.__column(name, "start"), t) - 1
+
+        if index < 0 or not self.__covers(name, index, t):
+            return None
+
+        return getattr(self, name)[index]
+
+    def __range(self, name: str, t0: float, t1: float) -> List[Any]:
+        starts = self.__column(name, "start")
+
+        # The interval playing at t0 overlaps the span even though it starts before it
+        lo = max(bisect_right(starts, t0) - 1, 0)
+
+        if lo < len(starts) and not self.__covers(name, lo, t0) and starts[lo] < t0:
+            lo += 1
+
+        hi = bisect_left(starts, t1)
+
+        return getattr(self, name)[lo:hi]
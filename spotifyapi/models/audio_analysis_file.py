@@ -0,0 +1,177 @@
+"""Provide the binary audio analysis file format."""
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, List, Mapping, Tuple
+
+MAGIC = b"SPAA"
+VERSION = 1
+
+# The header: magic, version, byte order (0 little, 1 big), padding and the number of rows of each array
+HEADER = struct.Struct("<4sHBx5Q")
+
+_INTERVAL = (("start", "d", 1), ("duration", "d", 1), ("confidence", "d", 1))
+
+# The columns of each array as (field, typecode, values per row), in the order they are stored
+FIELDS = {
+    "bars": _INTERVAL,
+    "beats": _INTERVAL,
+    "sections": _INTERVAL
+    + (
+        ("loudness", "d", 1),
+        ("tempo", "d", 1),
+        ("tempo_confidence", "d", 1),
+        ("key", "i", 1),
+        ("key_confidence", "d", 1),
+        ("mode", "i", 1),
+        ("mode_confidence", "d", 1),
+        ("time_signature", "i", 1),
+        ("time_signature_confidence", "d", 1),
+    ),
+    "segments": _INTERVAL
+    + (
+        ("loudness_start", "d", 1),
+        ("loudness_max", "d", 1),
+        ("loudness_max_time", "d", 1),
+        ("pitches", "f", 12),
+        ("timbre", "f", 12),
+    ),
+    "tatums": _INTERVAL,
+}
+
+
+class RecordArray(Sequence):
+    """A read-only sequence of records stored as one typed array per field, such as the arrays of an audio analysis
+    file. Records are produced as dicts on access, in the shape of the API data, so no memory is used for them up
+    front.
+
+    Args:
+        fields: The fields of the records as (field, typecode, values per row).
+        columns: The values of each field, with values per row entries for each record.
+        length: The number of records.
+    """
+
+    __slots__ = ("_fields", "_columns", "_length")
+
+    def __init__(
+        self,
+        fields: Tuple[Tuple[str, str, int], ...],
+        columns: Mapping[str, memoryview],
+        length: int,
+    ):
+        self._fields = fields
+        self._columns = columns
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("RecordArray index out of range")
+
+        record = {}
+
+        for field, _, width in self._fields:
+            column = self._columns[field]
+
+            if width == 1:
+                record[field] = column[index]
+            else:
+                record[field] = column[index * width : (index + 1) * width].tolist()
+
+        return record
+
+    def column(self, field: str) -> memoryview:
+        """Get the values of a field for every record without copying them.
+
+        Args:
+            field: The name of the field.
+
+        Returns:
+            The values of the field. Fields with several values per record are flattened row by row.
+        """
+        return self._columns[field]
+
+
+def dump(data: Mapping[str, List[Mapping[str, Any]]], path: str) -> None:
+    """Write the arrays of an audio analysis to a file.
+
+    Args:
+        data: The data of each array of the audio analysis by name.
+        path: The path of the file.
+    """
+    byteorder = 0 if sys.byteorder == "little" else 1
+    records = {name: data[name] for name in FIELDS}
+
+    with open(path, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC, VERSION, byteorder, *(len(records[name]) for name in FIELDS)
+            )
+        )
+
+        for name, fields in FIELDS.items():
+            for field, typecode, width in fields:
+                values = array(typecode)
+
+                for record in records[name]:
+                    if width == 1:
+                        values.append(record[field])
+                    else:
+                        values.extend(record[field])
+
+                f.write(values.tobytes())
+                f.write(bytes(-f.tell() % 8))
+
+
+def load(path: str) -> Dict[str, RecordArray]:
+    """Map the arrays of an audio analysis file into memory. Nothing is read until it is accessed, and the columns are
+    views of the mapping rather than copies.
+
+    Args:
+        path: The path of the file.
+
+    Returns:
+        The records of each array of the audio analysis by name.
+
+    Raises:
+        ValueError: If the file is not an audio analysis file that can be read on this machine.
+    """
+    with open(path, "rb") as f:
+        buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"{path} is not an audio analysis file")
+
+    magic, version, byteorder, *lengths = HEADER.unpack_from(buffer)
+
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not an audio analysis file of version {VERSION}")
+
+    if byteorder != (0 if sys.byteorder == "little" else 1):
+        raise ValueError(f"{path} was written on a machine with another byte order")
+
+    offset = HEADER.size + (-HEADER.size % 8)
+    arrays = {}
+
+    for (name, fields), length in zip(FIELDS.items(), lengths):
+        columns = {}
+
+        for field, typecode, width in fields:
+            size = array(typecode).itemsize * width * length
+
+            if offset + size > len(buffer):
+                raise ValueError(f"{path} is truncated")
+
+            columns[field] = buffer[offset : offset + size].cast(typecode)
+            offset += size + (-size % 8)
+
+        arrays[name] = RecordArray(fields, columns, length)
+
+    return arrays
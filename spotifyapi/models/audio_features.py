@@ -4,6 +4,27 @@
 class AudioFeatures:
     """The audio features of a track."""
 
+    __slots__ = (
+        "_duration_ms",
+        "_key",
+        "_mode",
+        "_time_signature",
+        "_acousticness",
+        "_danceability",
+        "_energy",
+        "_instrumentalness",
+        "_liveness",
+        "_loudness",
+        "_speechiness",
+        "_valence",
+        "_tempo",
+        "_id",
+        "_uri",
+        "_track_href",
+        "_analysis_url",
+        "_type",
+    )
+
     def __init__(self, data):
         self._duration_ms = data["duration_ms"]
         self._key = data["key"]
@@ -162,7 +183,8 @@ class AudioFeatures:
     @property
     def analysis_url(self) -> str:
         """
-        An HTTP URL to access the full audio analysis of this track. An access token is required to access this data."""
+        An HTTP URL to access the full audio analysis of this track. An access token is required to access this data.
+        """
         return self._analysis_url
 
     @property
@@ -0,0 +1,158 @@
+"""Provide the audio features batch model."""
+from array import array
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class AudioFeaturesBatch:
+    """The audio features of many tracks, stored as one array per feature instead of one object per track. Rows are in
+    the order the tracks were requested, and tracks without audio features are left out.
+
+    Missing values are stored as MISSING_INT in the integer columns, the value the API itself gives a key it could not
+    detect, and as NaN in the float columns. Integer features the API sends as floats, such as 4.0, are truncated.
+
+    Args:
+        data: The audio features data of the tracks, with None for tracks that have none.
+    """
+
+    # The features and the typecode of the array they are stored in
+    COLUMNS = (
+        ("acousticness", "d"),
+        ("danceability", "d"),
+        ("duration_ms", "q"),
+        ("energy", "d"),
+        ("instrumentalness", "d"),
+        ("key", "b"),
+        ("liveness", "d"),
+        ("loudness", "d"),
+        ("mode", "b"),
+        ("speechiness", "d"),
+        ("tempo", "d"),
+        ("time_signature", "b"),
+        ("valence", "d"),
+    )
+
+    # The value missing integer features are stored as
+    MISSING_INT = -1
+
+    __slots__ = ("_ids", "_index", "_columns")
+
+    def __init__(self, data: List[Optional[dict]]):
+        rows = [d for d in data if d]
+
+        self._ids = [d["id"] for d in rows]
+        self._columns = {
+            name: self._column(rows, name, typecode) for name, typecode in self.COLUMNS
+        }
+
+        # Keep the first row of tracks that were requested more than once
+        self._index = dict(zip(reversed(self._ids), range(len(self._ids) - 1, -1, -1)))
+
+    @classmethod
+    def _column(cls, rows: List[dict], name: str, typecode: str) -> array:
+        # Take the fast path first, since the API hardly ever leaves out a value or sends one of the wrong type
+        try:
+            return array(typecode, map(itemgetter(name), rows))
+        except (KeyError, TypeError):
+            pass
+
+        if typecode == "d":
+            missing, convert = float("nan"), float
+        else:
+            missing, convert = cls.MISSING_INT, int
+
+        return array(
+            typecode,
+            (missing if row.get(name) is None else convert(row[name]) for row in rows),
+        )
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._index
+
+    @property
+    def ids(self) -> List[str]:
+        """The Spotify IDs of the tracks, one per row."""
+        return self._ids
+
+    @property
+    def columns(self) -> Dict[str, array]:
+        """Every feature column by name."""
+        return self._columns
+
+    def column(self, name: str) -> array:
+        """Get the values of a feature for every track.
+
+        Args:
+            name: The name of the feature, such as "danceability" or "tempo".
+
+        Returns:
+            The values of the feature, one per row.
+
+        Raises:
+            KeyError: If there is no such feature.
+        """
+        return self._columns[name]
+
+    def index(self, id: str) -> int:
+        """Get the row of a track.
+
+        Args:
+            id: The Spotify ID of the track.
+
+        Returns:
+            The row of the track in the columns.
+
+        Raises:
+            KeyError: If the batch has no audio features for the track.
+        """
+        return self._index[id]
+
+    def get(self, id: str, name: str) -> Any:
+        """Get the value of a feature for a single track.
+
+        Args:
+            id: The Spotify ID of the track.
+            name: The name of the feature.
+
+        Returns:
+            The value of the feature for the track.
+
+        Raises:
+            KeyError: If the batch has no audio features for the track or there is no such feature.
+        """
+        return self._columns[name][self._index[id]]
+
+    def to_numpy(self) -> Any:
+        """Convert the batch to a structured NumPy array with an "id" field and a field per feature. It requires NumPy,
+        which can be installed with `pip install spotifyapi[numpy]`.
+
+        Returns:
+            The structured array, with one record per row.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError(
+                "to_numpy requires numpy, install it with `pip install spotifyapi[numpy]`"
+            )
+
+        dtype = [("id", "U22")] + [
+            (name, np.dtype(typecode)) for name, typecode in self.COLUMNS
+        ]
+        result = np.empty(len(self._ids), dtype=dtype)
+        result["id"] = self._ids
+
+        for name, _ in self.COLUMNS:
+            # The arrays support the buffer protocol, so they are copied without going through Python objects
+            result[name] = np.frombuffer(self._columns[name], dtype=result.dtype[name])
+
+        return result
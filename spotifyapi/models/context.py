@@ -5,6 +5,8 @@ from typing import Dict, Optional
 class Context:
     """An item's context."""
 
+    __slots__ = ("_uri", "_href", "_external_urls", "_type")
+
     def __init__(self, data):
         self._uri = data["uri"]
         self._href = data["href"]
@@ -4,6 +4,8 @@
 class Copyright:
     """The copyright information of an album."""
 
+    __slots__ = ("_text", "_type")
+
     def __init__(self, data):
         self._text = data["text"]
         self._type = data["type"]
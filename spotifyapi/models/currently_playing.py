@@ -9,17 +9,29 @@ from .full_track import FullTrack
 class CurrentlyPlaying:
     """Information about the currently playing track."""
 
+    __slots__ = (
+        "_context",
+        "_timestamp",
+        "_progress_ms",
+        "_is_playing",
+        "_track",
+        "_currently_playing_type",
+    )
+
     def __init__(self, data):
-        self._context = Context(data["context"]) if data["context"] else None
+        self._context = data["context"] or None
         self._timestamp = data["timestamp"]
         self._progress_ms = data["progress_ms"]
         self._is_playing = data["is_playing"]
-        self._track = FullTrack(data["item"])
+        self._track = data["item"]
         self._currently_playing_type = data["currently_playing_type"]
 
     @property
     def context(self) -> Optional[Context]:
         """A Context Object. Can be None."""
+        if isinstance(self._context, dict):
+            self._context = Context(self._context)
+
         return self._context
 
     @property
@@ -40,6 +52,9 @@ class CurrentlyPlaying:
     @property
     def track(self) -> Optional[FullTrack]:
         """The currently playing track. Can be None."""
+        if isinstance(self._track, dict):
+            self._track = FullTrack(self._track)
+
         return self._track
 
     @property
@@ -51,16 +66,21 @@ class CurrentlyPlaying:
 class CurrentlyPlayingContext(CurrentlyPlaying):
     """Information about the currently playing track."""
 
+    __slots__ = ("_device", "_repeat_state", "_shuffle_state")
+
     def __init__(self, data):
         super().__init__(data)
 
-        self._device = Device(data["device"])
+        self._device = data["device"]
         self._repeat_state = data["repeat_state"]
         self._shuffle_state = data["shuffle_state"]
 
     @property
     def device(self) -> Device:
         """The device that is currently active."""
+        if isinstance(self._device, dict):
+            self._device = Device(self._device)
+
         return self._device
 
     @property
@@ -5,6 +5,16 @@ from typing import Optional
 class Device:
     """Any device."""
 
+    __slots__ = (
+        "_id",
+        "_is_active",
+        "_is_private_session",
+        "_is_restricted",
+        "_name",
+        "_type",
+        "_volume_percent",
+    )
+
     def __init__(self, data):
         self._id = data["id"]
         self._is_active = data["is_active"]
@@ -5,6 +5,8 @@ from typing import Optional
 class Followers:
     """The total followers."""
 
+    __slots__ = ("_href", "_total")
+
     def __init__(self, data):
         self._href = data["href"]
         self._total = data["total"]
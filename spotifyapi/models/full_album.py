@@ -3,6 +3,7 @@ from typing import Dict, List
 
 from .album import Album
 from .copyright import Copyright
+from .lazy_list import build_list
 from .paging import Paging
 from .simplified_track import SimplifiedTrack
 
@@ -10,19 +11,30 @@ from .simplified_track import SimplifiedTrack
 class FullAlbum(Album):
     """A full album."""
 
+    __slots__ = (
+        "_copyrights",
+        "_external_ids",
+        "_genres",
+        "_label",
+        "_popularity",
+        "_tracks",
+    )
+
     def __init__(self, data):
         super().__init__(data)
 
-        self._copyrights = [Copyright(d) for d in data["copyrights"]]
+        self._copyrights = data["copyrights"] or []
         self._external_ids = data["external_ids"]
         self._genres = data["genres"]
         self._label = data["label"]
         self._popularity = data["popularity"]
-        self._tracks = Paging(data["tracks"], SimplifiedTrack)
+        self._tracks = data["tracks"]
 
     @property
     def copyrights(self) -> List[Copyright]:
         """The copyright statements of the album."""
+        self._copyrights = build_list(self._copyrights, Copyright)
+
         return self._copyrights
 
     @property
@@ -51,4 +63,7 @@ class FullAlbum(Album):
     @property
     def tracks(self) -> Paging:
         """The tracks of the album."""
+        if isinstance(self._tracks, dict):
+            self._tracks = Paging(self._tracks, SimplifiedTrack, lazy=True)
+
         return self._tracks
@@ -4,22 +4,28 @@ from typing import List
 from .artist import Artist
 from .followers import Followers
 from .image import Image
+from .lazy_list import build_list
 
 
 class FullArtist(Artist):
     """A full artist."""
 
+    __slots__ = ("_followers", "_genres", "_images", "_popularity")
+
     def __init__(self, data):
         super().__init__(data)
 
-        self._followers = Followers(data["followers"])
+        self._followers = data["followers"]
         self._genres = data["genres"]
-        self._images = [Image(d) for d in data["images"]]
+        self._images = data["images"] or []
         self._popularity = data["popularity"]
 
     @property
     def followers(self) -> Followers:
         """Information about the followers of the artist."""
+        if isinstance(self._followers, dict):
+            self._followers = Followers(self._followers)
+
         return self._followers
 
     @property
@@ -33,6 +39,8 @@ class FullArtist(Artist):
     @property
     def images(self) -> List[Image]:
         """Images of the artist in various sizes, widest first."""
+        self._images = build_list(self._images, Image)
+
         return self._images
 
     @property
@@ -1,21 +1,29 @@
 """Provide the full playlist model."""
-from typing import Generator, Optional
+from typing import Any, AsyncGenerator, Callable, Generator, Optional, Union
+from requests import Session
 
 from .followers import Followers
-from .paging import Paging
 from .playlist import Playlist
 from .playlist_track import PlaylistTrack
 
 
 class FullPlaylist(Playlist):
-    """A full playlist."""
+    """A full playlist.
 
-    def __init__(self, data, oauth):
+    Args:
+        data: The playlist data.
+        fetch: Takes a URL and returns its decoded JSON, used to get the rest of the tracks. This is usually the _get
+            of the endpoint. A session such as an OAuth2Session is still accepted, as in earlier versions, see generate.
+    """
+
+    __slots__ = ("_fetch", "_description", "_followers")
+
+    def __init__(self, data, fetch: Union[Callable[[str], Any], Session]):
         super().__init__(data)
-        self._oauth = oauth  # Used to generate tracks
+        self._fetch = fetch  # Used to generate tracks
 
         self._description = data["description"]
-        self._followers = Followers(data["followers"])
+        self._followers = data["followers"]
         self._tracks = data["tracks"]
 
     @property
@@ -26,19 +34,57 @@ class FullPlaylist(Playlist):
     @property
     def followers(self):
         """Information about the followers of the playlist."""
+        if isinstance(self._followers, dict):
+            self._followers = Followers(self._followers)
+
         return self._followers
 
     @property
     def tracks(self) -> Generator[PlaylistTrack, None, None]:
         """Information about the tracks of the playlist."""
-        paging = Paging(self._tracks, PlaylistTrack)
+        return self.iter_tracks()
+
+    def iter_tracks(
+        self, workers: Optional[int] = None, prefetch: Optional[int] = None
+    ) -> Generator[PlaylistTrack, None, None]:
+        """Yield the tracks of the playlist.
+
+        Args:
+            workers: If given, fetch the remaining pages of tracks concurrently with at most this many workers.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is consumed.
+
+        Returns:
+            A generator of the playlist's tracks.
+        """
+        # Imported here since utils depends on the models package
+        from ..utils import generate
+
+        return generate(self._tracks, PlaylistTrack, self._fetch, workers, prefetch)
+
+
+class AsyncFullPlaylist(FullPlaylist):
+    """A full playlist whose tracks are fetched asynchronously with a coroutine function."""
+
+    __slots__ = ()
+
+    @property
+    def tracks(self) -> AsyncGenerator[PlaylistTrack, None]:
+        """Information about the tracks of the playlist."""
+        return self.iter_tracks()
+
+    def iter_tracks(
+        self, workers: Optional[int] = None, prefetch: Optional[int] = None
+    ) -> AsyncGenerator[PlaylistTrack, None]:
+        """Asynchronously yield the tracks of the playlist.
 
-        while True:
-            for item in paging.items:
-                yield item
+        Args:
+            workers: If given, fetch the remaining pages of tracks concurrently with at most this many requests in
+                flight.
+            prefetch: If given, load up to this many pages ahead in the background while the current one is consumed.
 
-            if not paging.next:
-                break
+        Returns:
+            An async generator of the playlist's tracks.
+        """
+        from ..utils import agenerate
 
-            response = self._oauth.get(paging.next)
-            paging = Paging(response.json(), PlaylistTrack)
+        return agenerate(self._tracks, PlaylistTrack, self._fetch, workers, prefetch)
@@ -8,10 +8,12 @@ from .track import Track
 class FullTrack(Track):
     """A full track."""
 
+    __slots__ = ("_album", "_external_ids", "_popularity")
+
     def __init__(self, data):
         super().__init__(data)
 
-        self._album = SimplifiedAlbum(data["album"])
+        self._album = data["album"]
         self._external_ids = data["external_ids"]
         self._popularity = data["popularity"]
 
@@ -21,6 +23,9 @@ class FullTrack(Track):
         The album on which the track appears. The album object includes a link in href to full information about the
         album.
         """
+        if isinstance(self._album, dict):
+            self._album = SimplifiedAlbum(self._album)
+
         return self._album
 
     @property
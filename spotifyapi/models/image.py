@@ -5,6 +5,8 @@ from typing import Optional
 class Image:
     """Image artwork."""
 
+    __slots__ = ("_height", "_url", "_width")
+
     def __init__(self, data):
         self._height = data["height"]
         self._url = data["url"]
@@ -0,0 +1,92 @@
+"""Provide the lazy JSON object model."""
+import json
+import re
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable, Iterator
+
+
+class LazyJSONObject(Mapping):
+    """A read-only mapping over the top-level values of an encoded JSON object that only decodes a value when it is
+    first accessed, so values that are never looked at are never turned into Python objects.
+
+    The values are found with a single scan for the given keys instead of parsing the whole document. This relies on
+    the keys not being used anywhere else in the document, such as in nested objects. If they are, or the document
+    has other top-level keys that get in the way, the whole document is decoded instead, so the values are always
+    correct.
+
+    Args:
+        content: The encoded JSON object.
+        keys: The top-level keys of the object.
+        loads: Decodes JSON. Default: json.loads.
+    """
+
+    __slots__ = ("_content", "_spans", "_values", "_loads")
+
+    def __init__(
+        self,
+        content: bytes,
+        keys: Iterable[str],
+        loads: Callable[[bytes], Any] = json.loads,
+    ):
+        self._content = content
+        self._spans = {}
+        self._values = {}
+        self._loads = loads
+
+        pattern = re.compile(
+            rb'"(' + b"|".join(re.escape(key.encode()) for key in keys) + rb')"\s*:\s*'
+        )
+        found = [
+            (m.group(1).decode(), m.start(), m.end()) for m in pattern.finditer(content)
+        ]
+
+        # A key that is also used in nested objects can't be told apart from the top-level one
+        if len({key for key, _, _ in found}) != len(found):
+            self._decode_all()
+            return
+
+        for i, (key, _, start) in enumerate(found):
+            if i + 1 < len(found):
+                # The value is followed by a comma and the next key
+                end = content.rindex(b",", start, found[i + 1][1])
+            else:
+                # The value is followed by the end of the object
+                end = content.rindex(b"}", start)
+
+            self._spans[key] = (start, end)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+
+        if key not in self._spans:
+            raise KeyError(key)
+
+        start, end = self._spans.pop(key)
+
+        try:
+            self._values[key] = self._loads(self._content[start:end])
+        except ValueError:
+            # The span also covers a top-level key that wasn't scanned for
+            self._decode_all()
+
+        # Let the document go once every value has been decoded
+        if not self._spans:
+            self._content = None
+
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._values
+        yield from self._spans
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._spans)
+
+    def __repr__(self) -> str:
+        return f"LazyJSONObject({len(self._values)} of {len(self)} values decoded)"
+
+    def _decode_all(self) -> None:
+        self._values = self._loads(self._content)
+        self._spans = {}
+        self._content = None
@@ -0,0 +1,77 @@
+"""Provide the lazy list model."""
+from collections.abc import Sequence
+from typing import Any, Callable, Iterator, List
+
+
+class LazyList(Sequence):
+    """A read-only list of objects that are only built from their raw data when they are first accessed. Built objects
+    are kept, so accessing an item again returns the same object.
+
+    Args:
+        data: The raw data of the items. A list is copied, while any other sequence, such as a RecordArray, is only
+            read an item at a time as the items are built.
+        object_factory: Builds an item from its raw data.
+    """
+
+    __slots__ = ("_items", "_built", "_object_factory", "_source")
+
+    def __init__(self, data: Sequence, object_factory: Callable[[Any], Any]):
+        if isinstance(data, list):
+            self._items = list(data)
+            self._source = None
+        else:
+            self._items = [None] * len(data)
+            self._source = data
+
+        self._built = bytearray(len(self._items))
+        self._object_factory = object_factory
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(len(self._items)))]
+
+        if index < 0:
+            index += len(self._items)
+
+        if not 0 <= index < len(self._items):
+            raise IndexError("LazyList index out of range")
+
+        return self._build(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self._items)):
+            yield self._build(i)
+
+    def __repr__(self) -> str:
+        return f"LazyList({len(self._items)} items of {self._object_factory.__name__})"
+
+    def _build(self, index: int) -> Any:
+        if not self._built[index]:
+            data = self._items[index] if self._source is None else self._source[index]
+
+            # The raw data is replaced by the built object so it can be freed
+            self._items[index] = self._object_factory(data)
+            self._built[index] = 1
+
+        return self._items[index]
+
+
+def build_list(items: List[Any], object_factory: Callable[[Any], Any]) -> List[Any]:
+    """Build the objects of a list property from their raw data on first access, so models can keep the raw data until
+    then and still hand out a plain list. Empty lists can't be told apart from built ones, so they have to be replaced
+    by a new list up front rather than be kept, or the raw data would be handed out.
+
+    Args:
+        items: The raw data of the items, or the objects built from it on an earlier access.
+        object_factory: Builds an item from its raw data.
+
+    Returns:
+        A new list of the built objects, or items itself if they are already built.
+    """
+    if items and isinstance(items[0], dict):
+        return [object_factory(d) for d in items]
+
+    return items
@@ -1,5 +1,7 @@
 """Provide the paging model."""
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence
+
+from .lazy_list import LazyList
 
 
 class Paging:
@@ -7,13 +9,40 @@ class Paging:
     The offset-based paging object is a container for a set of objects. It contains a key called items (whose value is
     an array of the requested objects) along with other keys like previous, next and limit that can be useful in future
     calls.
+
+    Args:
+        data: The paging data.
+        object_factory: The type of object in items, or None to keep the data of the items as is.
+        lazy: If true, items are only built from their data when they are first accessed, so items that are never
+            looked at cost nothing.
     """
 
-    def __init__(self, data, object_factory: Any):
+    __slots__ = (
+        "_href",
+        "_limit",
+        "_next",
+        "_offset",
+        "_previous",
+        "_total",
+        "_object_factory",
+        "_items",
+    )
+
+    def __init__(self, data, object_factory: Any, lazy: bool = False):
         self._href = data["href"]
-        self._items = [object_factory(d) for d in data["items"]]
+
+        if object_factory is None:
+            self._items = data["items"]
+        elif lazy:
+            self._items = LazyList(data["items"], object_factory)
+        else:
+            self._items = [object_factory(d) for d in data["items"]]
+
         self._limit = data["limit"]
         self._next = data["next"]
+        self._offset = data["offset"] if "offset" in data else None
+        self._previous = data["previous"] if "previous" in data else None
+        self._total = data["total"] if "total" in data else None
 
         self._object_factory = object_factory
 
@@ -23,8 +52,8 @@ class Paging:
         return self._href
 
     @property
-    def items(self) -> List[Any]:
-        """The requested data."""
+    def items(self) -> Sequence[Any]:
+        """The requested data. A LazyList if the paging object is lazy, otherwise a list."""
         return self._items
 
     @property
@@ -37,6 +66,21 @@ class Paging:
         """URL to the next page of items."""
         return self._next
 
+    @property
+    def offset(self) -> Optional[int]:
+        """The offset of the items returned (as set in the query or by default). None for cursor-based paging."""
+        return self._offset
+
+    @property
+    def previous(self) -> Optional[str]:
+        """URL to the previous page of items."""
+        return self._previous
+
+    @property
+    def total(self) -> Optional[int]:
+        """The total number of items available to return. None if not reported."""
+        return self._total
+
     @property
     def object_factory(self) -> Any:
         """The type of object in items."""
@@ -8,14 +8,19 @@ from .simplified_track import SimplifiedTrack
 class PlayHistory:
     """A previously played track."""
 
+    __slots__ = ("_track", "_played_at", "_context")
+
     def __init__(self, data):
-        self._track = SimplifiedTrack(data["track"])
+        self._track = data["track"]
         self._played_at = data["played_at"]
-        self._context = Context(data["context"]) if data["context"] else None
+        self._context = data["context"] or None
 
     @property
     def track(self) -> SimplifiedTrack:
         """The track the user listened to."""
+        if isinstance(self._track, dict):
+            self._track = SimplifiedTrack(self._track)
+
         return self._track
 
     @property
@@ -26,4 +31,7 @@ class PlayHistory:
     @property
     def context(self) -> Optional[Context]:
         """The context the track was played from."""
+        if isinstance(self._context, dict):
+            self._context = Context(self._context)
+
         return self._context
@@ -2,6 +2,7 @@
 from typing import Dict, List, Optional
 
 from .image import Image
+from .lazy_list import build_list
 from .public_user import PublicUser
 from .tracks import Tracks
 
@@ -9,17 +10,31 @@ from .tracks import Tracks
 class Playlist:
     """A playlist."""
 
+    __slots__ = (
+        "_collaborative",
+        "_external_urls",
+        "_href",
+        "_id",
+        "_images",
+        "_name",
+        "_owner",
+        "_public",
+        "_snapshot_id",
+        "_tracks",
+        "_uri",
+    )
+
     def __init__(self, data):
         self._collaborative = data["collaborative"]
         self._external_urls = data["external_urls"]
         self._href = data["href"]
         self._id = data["id"]
-        self._images = [Image(d) for d in data["images"]]
+        self._images = data["images"] or []
         self._name = data["name"]
-        self._owner = PublicUser(data["owner"])
+        self._owner = data["owner"]
         self._public = data["public"]
         self._snapshot_id = data["snapshot_id"]
-        self._tracks = Tracks(data["tracks"])
+        self._tracks = data["tracks"]
         self._uri = data["uri"]
 
     @property
@@ -53,6 +68,8 @@ class Playlist:
 
         Note: If returned, the source URL for the image is temporary and will expire in less than a day.
         """
+        self._images = build_list(self._images, Image)
+
         return self._images
 
     @property
@@ -63,6 +80,9 @@ class Playlist:
     @property
     def owner(self) -> PublicUser:
         """The user who owns the playlist"""
+        if isinstance(self._owner, dict):
+            self._owner = PublicUser(self._owner)
+
         return self._owner
 
     @property
@@ -88,6 +108,9 @@ class Playlist:
         A collection containing a link to the Web API endpoint where full details of the playlist’s tracks can be
         retrieved, along with the total number of tracks in the playlist.
         """
+        if isinstance(self._tracks, dict):
+            self._tracks = Tracks(self._tracks)
+
         return self._tracks
 
     @property
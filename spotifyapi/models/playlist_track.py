@@ -8,12 +8,21 @@ from .public_user import PublicUser
 class PlaylistTrack:
     """Information about the tracks of the playlist."""
 
+    __slots__ = (
+        "_added_at",
+        "_added_by",
+        "_is_local",
+        "_primary_color",
+        "_track",
+        "_video_thumbnail",
+    )
+
     def __init__(self, data):
         self._added_at = data["added_at"]
-        self._added_by = PublicUser(data["added_by"]) if data["added_by"] else None
+        self._added_by = data["added_by"] or None
         self._is_local = data["is_local"]
         self._primary_color = data["primary_color"]
-        self._track = FullTrack(data["track"])
+        self._track = data["track"]
         self._video_thumbnail = data["video_thumbnail"]["url"]
 
     @property
@@ -24,6 +33,9 @@ class PlaylistTrack:
     @property
     def added_by(self) -> Optional[PublicUser]:
         """The Spotify user who added the track. Note that some very old playlists may return null in this field."""
+        if isinstance(self._added_by, dict):
+            self._added_by = PublicUser(self._added_by)
+
         return self._added_by
 
     @property
@@ -39,6 +51,9 @@ class PlaylistTrack:
     @property
     def track(self) -> FullTrack:
         """Information about the track."""
+        if isinstance(self._track, dict):
+            self._track = FullTrack(self._track)
+
         return self._track
 
     @property
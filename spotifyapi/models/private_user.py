@@ -6,6 +6,8 @@ from .user import User
 class PrivateUser(User):
     """Private user profile."""
 
+    __slots__ = ("_country", "_email", "_product")
+
     def __init__(self, data):
         super().__init__(data)
 
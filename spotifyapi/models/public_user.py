@@ -5,5 +5,7 @@ from .user import User
 class PublicUser(User):
     """Public user profile"""
 
+    __slots__ = ()
+
     def __init__(self, data):
         super().__init__(data)
@@ -5,9 +5,11 @@ from .full_album import FullAlbum
 class SavedAlbum:
     """A saved album."""
 
+    __slots__ = ("_added_at", "_album")
+
     def __init__(self, data):
         self._added_at = data["added_at"]
-        self._album = FullAlbum(data["album"])
+        self._album = data["album"]
 
     @property
     def added_at(self) -> str:
@@ -17,4 +19,7 @@ class SavedAlbum:
     @property
     def album(self) -> FullAlbum:
         """Information about the album."""
+        if isinstance(self._album, dict):
+            self._album = FullAlbum(self._album)
+
         return self._album
@@ -5,9 +5,11 @@ from .full_track import FullTrack
 class SavedTrack:
     """A saved track."""
 
+    __slots__ = ("_added_at", "_track")
+
     def __init__(self, data):
         self._added_at = data["added_at"]
-        self._track = FullTrack(data["track"])
+        self._track = data["track"]
 
     @property
     def added_at(self) -> str:
@@ -17,4 +19,7 @@ class SavedTrack:
     @property
     def track(self) -> FullTrack:
         """Information about the track."""
+        if isinstance(self._track, dict):
+            self._track = FullTrack(self._track)
+
         return self._track
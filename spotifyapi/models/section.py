@@ -4,6 +4,21 @@
 class Section:
     """A section of a track that is relatively uniform."""
 
+    __slots__ = (
+        "_start",
+        "_duration",
+        "_confidence",
+        "_loudness",
+        "_tempo",
+        "_tempo_confidence",
+        "_key",
+        "_key_confidence",
+        "_mode",
+        "_mode_confidence",
+        "_time_signature",
+        "_time_signature_confidence",
+    )
+
     def __init__(self, data):
         self._start = data["start"]
         self._duration = data["duration"]
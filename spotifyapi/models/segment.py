@@ -5,6 +5,17 @@ from typing import List
 class Segment:
     """A segment of a track that is relatively uniform."""
 
+    __slots__ = (
+        "_start",
+        "_duration",
+        "_confidence",
+        "_loudness_start",
+        "_loudness_max",
+        "_loudness_max_time",
+        "_pitches",
+        "_timbre",
+    )
+
     def __init__(self, data):
         self._start = data["start"]
         self._duration = data["duration"]
@@ -0,0 +1,80 @@
+"""Provide the segment arrays model."""
+from typing import Any, NamedTuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .audio_analysis_file import RecordArray
+
+
+class SegmentArrays(NamedTuple):
+    """The segments of an audio analysis as NumPy arrays, with one row per segment in the order of the analysis.
+
+    Attributes:
+        start: The starting points (in seconds) of the segments, as float64.
+        duration: The durations (in seconds) of the segments, as float64.
+        confidence: The confidences of the segmentation, as float32.
+        loudness_start: The onset loudness (in dB) of the segments, as float32.
+        loudness_max: The peak loudness (in dB) of the segments, as float32.
+        loudness_max_time: The segment-relative offsets (in seconds) of the peak loudness, as float64.
+        pitches: The N×12 matrix of the chroma vectors of the segments, as float32.
+        timbre: The N×12 matrix of the timbre vectors of the segments, as float32.
+    """
+
+    start: Any
+    duration: Any
+    confidence: Any
+    loudness_start: Any
+    loudness_max: Any
+    loudness_max_time: Any
+    pitches: Any
+    timbre: Any
+
+    @classmethod
+    def from_data(cls, data: Sequence[dict]) -> "SegmentArrays":
+        """Build the arrays straight from the segment data of an audio analysis, without building Segment objects.
+
+        Args:
+            data: The segment data, such as the segments of an audio analysis file.
+
+        Returns:
+            The segment arrays.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError(
+                "Segment arrays require numpy, install it with `pip install spotifyapi[numpy]`"
+            )
+
+        count = len(data)
+
+        def vector(key, dtype):
+            if isinstance(data, RecordArray):
+                # The columns of an audio analysis file are used in place when their type matches
+                column = np.frombuffer(data.column(key), dtype=np.float64)
+                return column.astype(dtype, copy=False)
+
+            return np.fromiter((d[key] for d in data), dtype=dtype, count=count)
+
+        def matrix(key):
+            if isinstance(data, RecordArray):
+                values = np.frombuffer(data.column(key), dtype=np.float32)
+            else:
+                values = np.array([d[key] for d in data], dtype=np.float32)
+
+            return values.reshape(count, 12)
+
+        return cls(
+            start=vector("start", np.float64),
+            duration=vector("duration", np.float64),
+            confidence=vector("confidence", np.float32),
+            loudness_start=vector("loudness_start", np.float32),
+            loudness_max=vector("loudness_max", np.float32),
+            loudness_max_time=vector("loudness_max_time", np.float64),
+            pitches=matrix("pitches"),
+            timbre=matrix("timbre"),
+        )
@@ -5,5 +5,7 @@ from .artist import Artist
 class SimplifiedArtist(Artist):
     """A simplified artist. This is the same as Artist but matches the Spotify API naming scheme."""
 
+    __slots__ = ()
+
     def __init__(self, data):
         super().__init__(data)
@@ -5,5 +5,7 @@ from .track import Track
 class SimplifiedTrack(Track):
     """A simplified track. This is the same as Track but matches the Spotify API naming scheme."""
 
+    __slots__ = ()
+
     def __init__(self, data):
         super().__init__(data)
@@ -4,6 +4,8 @@
 class TimeInterval:
     """A generic object used to represent various time intervals within Audio Analysis."""
 
+    __slots__ = ("_start", "_duration", "_confidence")
+
     def __init__(self, data):
         self._start = data["start"]
         self._duration = data["duration"]
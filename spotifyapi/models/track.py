@@ -1,14 +1,32 @@
 """Provide the track model."""
 from typing import Dict, List, Optional
 
+from .lazy_list import build_list
 from .simplified_artist import SimplifiedArtist
 
 
 class Track:
     """A track."""
 
+    __slots__ = (
+        "_artists",
+        "_available_markets",
+        "_disc_number",
+        "_duration_ms",
+        "_explicit",
+        "_external_urls",
+        "_href",
+        "_id",
+        "_is_local",
+        "_name",
+        "_preview_url",
+        "_track_number",
+        "_type",
+        "_uri",
+    )
+
     def __init__(self, data):
-        self._artists = [SimplifiedArtist(d) for d in data["artists"]]
+        self._artists = data["artists"] or []
         self._available_markets = (
             data["available_markets"] if "available_markets" in data else None
         )
@@ -31,6 +49,8 @@ class Track:
         The artists who performed the track. Each artist object includes a link in href to more detailed information
         about the artist.
         """
+        self._artists = build_list(self._artists, SimplifiedArtist)
+
         return self._artists
 
     @property
@@ -4,6 +4,8 @@
 class Tracks:
     """A description of the tracks from a simplified playlist object."""
 
+    __slots__ = ("_href", "_total")
+
     def __init__(self, data):
         self._href = data["href"]
         self._total = data["total"]
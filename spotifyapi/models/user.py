@@ -3,18 +3,30 @@ from typing import Dict, List, Optional
 
 from .followers import Followers
 from .image import Image
+from .lazy_list import build_list
 
 
 class User:
     """A User."""
 
+    __slots__ = (
+        "_display_name",
+        "_external_urls",
+        "_followers",
+        "_href",
+        "_id",
+        "_images",
+        "_type",
+        "_uri",
+    )
+
     def __init__(self, data):
         self._display_name = data["display_name"] if "display_name" in data else None
         self._external_urls = data["external_urls"]
         self._followers = data["followers"] if "followers" in data else None
         self._href = data["href"]
         self._id = data["id"]
-        self._images = [Image(d) for d in data["images"]] if "images" in data else []
+        self._images = (data["images"] if "images" in data else None) or []
         self._type = data["type"]
         self._uri = data["uri"]
 
@@ -46,6 +58,8 @@ class User:
     @property
     def images(self) -> List[Image]:
         """The user’s profile image."""
+        self._images = build_list(self._images, Image)
+
         return self._images
 
     @property
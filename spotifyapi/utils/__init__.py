@@ -1,31 +1,385 @@
 """Provide the utils module."""
-from typing import Any, Generator
-from requests_oauthlib import OAuth2Session
+import asyncio
+import queue
+import requests
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 
 from ..models import Paging
 
 
 def generate(
-    data, object_factory: Any, session: OAuth2Session
+    data,
+    object_factory: Any,
+    fetch: Union[Callable[[str], Any], requests.Session],
+    workers: Optional[int] = None,
+    prefetch: Optional[int] = None,
+    raw: bool = False,
 ) -> Generator[Any, None, None]:
     """Yield all objects for a paging object
 
     Args:
         data: The initial paging data.
         object_factory: The type of object to yield.
-        session: The session used to get the rest of the items in the paging object.
+        fetch: Takes a URL and returns its decoded JSON, used to get the rest of the items in the paging object. This is
+            usually the _get of the endpoint, so pages share its error handling, retries, caching and rate limiting.
+            A session such as an OAuth2Session is still accepted, as in earlier versions, in which case pages are
+            fetched with its get method without any of that.
+        workers: If given, fetch the remaining pages concurrently with at most this many workers once the first page is
+            in. Items are still yielded in order. Cursor-based paging is always fetched one page at a time.
+        prefetch: If given, load up to this many pages ahead in the background while the current one is consumed.
+        raw: If true, yield the decoded JSON of each item instead of building an object_factory from it.
 
     Returns:
         A generator of the items in the paging object.
     """
-    paging = Paging(data, object_factory)
+    if raw:
+        object_factory = None
 
-    while True:
-        for item in paging.items:
-            yield item
+    if isinstance(fetch, requests.Session):
+        fetch = _session_fetch(fetch)
 
-        if not paging.next:
-            break
+    paging = Paging(data, object_factory, lazy=True)
 
-        response = session.get(paging.next)
-        paging = Paging(response.json(), object_factory)
+    def fetch_page(url: str) -> Paging:
+        return Paging(fetch(url), object_factory, lazy=True)
+
+    if workers and _is_offset_based(paging):
+        pages = _fetch_parallel(
+            paging, fetch_page, workers, max(workers, prefetch or 0)
+        )
+    elif prefetch:
+        pages = _fetch_ahead(paging, fetch_page, prefetch)
+    else:
+        pages = _fetch_sequential(paging, fetch_page)
+
+    try:
+        for page in pages:
+            for item in page.items:
+                yield item
+    finally:
+        pages.close()
+
+
+async def agenerate(
+    data,
+    object_factory: Any,
+    fetch: Callable[[str], Awaitable[Any]],
+    workers: Optional[int] = None,
+    prefetch: Optional[int] = None,
+    raw: bool = False,
+) -> AsyncGenerator[Any, None]:
+    """Asynchronously yield all objects for a paging object
+
+    Args:
+        data: The initial paging data.
+        object_factory: The type of object to yield.
+        fetch: A coroutine function that takes a URL and returns its decoded JSON, used to get the rest of the items in
+            the paging object.
+        workers: If given, fetch the remaining pages concurrently with at most this many requests in flight once the
+            first page is in. Items are still yielded in order. Cursor-based paging is always fetched one page at a
+            time.
+        prefetch: If given, load up to this many pages ahead in the background while the current one is consumed.
+        raw: If true, yield the decoded JSON of each item instead of building an object_factory from it.
+
+    Returns:
+        An async generator of the items in the paging object.
+    """
+    if raw:
+        object_factory = None
+
+    if isinstance(fetch, requests.Session):
+        raise TypeError(
+            "agenerate fetches pages with a coroutine function, such as the _get of an async endpoint, not a session"
+        )
+
+    paging = Paging(data, object_factory, lazy=True)
+
+    async def fetch_page(url: str) -> Paging:
+        return Paging(await fetch(url), object_factory, lazy=True)
+
+    if workers and _is_offset_based(paging):
+        pages = _afetch_parallel(
+            paging, fetch_page, workers, max(workers, prefetch or 0)
+        )
+    elif prefetch:
+        pages = _afetch_ahead(paging, fetch_page, prefetch)
+    else:
+        pages = _afetch_sequential(paging, fetch_page)
+
+    try:
+        async for page in pages:
+            for item in page.items:
+                yield item
+    finally:
+        await pages.aclose()
+
+
+def map_chunks(
+    func: Callable[[Sequence[Any]], Optional[List[Any]]],
+    items: Sequence[Any],
+    size: int,
+    workers: int = 4,
+) -> List[Any]:
+    """Split items into chunks and call a function on each of them concurrently.
+
+    Args:
+        func: Takes a chunk of items and returns a list of results, or None if there are none.
+        items: The items to split.
+        size: The maximum number of items in a chunk.
+        workers: The maximum number of chunks handled at once.
+
+    Returns:
+        The results of every chunk joined together in the order of the items.
+    """
+    chunks = [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+    if len(chunks) <= 1 or workers <= 1:
+        results = [func(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            results = list(executor.map(func, chunks))
+
+    return [result for chunk in results if chunk for result in chunk]
+
+
+async def amap_chunks(
+    func: Callable[[Sequence[Any]], Awaitable[Optional[List[Any]]]],
+    items: Sequence[Any],
+    size: int,
+    workers: int = 4,
+) -> List[Any]:
+    """Split items into chunks and asynchronously call a function on each of them concurrently.
+
+    Args:
+        func: A coroutine function that takes a chunk of items and returns a list of results, or None if there are
+            none.
+        items: The items to split.
+        size: The maximum number of items in a chunk.
+        workers: The maximum number of chunks handled at once.
+
+    Returns:
+        The results of every chunk joined together in the order of the items.
+    """
+    semaphore = asyncio.Semaphore(max(workers, 1))
+
+    async def bounded_func(chunk: Sequence[Any]) -> Optional[List[Any]]:
+        async with semaphore:
+            return await func(chunk)
+
+    results = await asyncio.gather(
+        *[bounded_func(list(items[i : i + size])) for i in range(0, len(items), size)]
+    )
+
+    return [result for chunk in results if chunk for result in chunk]
+
+
+def _session_fetch(session: requests.Session) -> Callable[[str], Any]:
+    """Wrap a session in a fetch function for generate, for callers that still pass one."""
+
+    def fetch(url: str) -> Any:
+        return session.get(url).json()
+
+    return fetch
+
+
+def _is_offset_based(paging: Paging) -> bool:
+    return paging.offset is not None and paging.total is not None
+
+
+def _page_urls(paging: Paging) -> Iterator[str]:
+    """Yield the URLs of the pages after the given one, built from its next URL."""
+    if not paging.next:
+        return
+
+    scheme, netloc, path, query, fragment = urlsplit(paging.next)
+    params = parse_qs(query, keep_blank_values=True)
+
+    for offset in range(paging.offset + paging.limit, paging.total, paging.limit):
+        params["offset"] = [str(offset)]
+        query = urlencode(params, doseq=True)
+
+        yield urlunsplit((scheme, netloc, path, query, fragment))
+
+
+def _fetch_sequential(
+    paging: Paging, fetch: Callable[[str], Paging]
+) -> Generator[Paging, None, None]:
+    """Yield the given page and the ones after it by following next links."""
+    yield paging
+
+    while paging.next:
+        paging = fetch(paging.next)
+        yield paging
+
+
+def _fetch_parallel(
+    paging: Paging, fetch: Callable[[str], Paging], workers: int, depth: int
+) -> Generator[Paging, None, None]:
+    """Yield the given page and the ones after it, in order, fetching up to `workers` of them at once and keeping
+    `depth` of them ahead of the consumer."""
+    urls = _page_urls(paging)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Start on the next pages before the consumer gets to the first one
+        pending = deque(executor.submit(fetch, url) for url in islice(urls, depth))
+
+        try:
+            yield paging
+
+            while pending:
+                page = pending.popleft().result()
+                pending.extend(executor.submit(fetch, url) for url in islice(urls, 1))
+
+                yield page
+        finally:
+            # Don't fetch pages nobody will read if the consumer stops early
+            for future in pending:
+                future.cancel()
+
+
+def _fetch_ahead(
+    paging: Paging, fetch: Callable[[str], Paging], depth: int
+) -> Generator[Paging, None, None]:
+    """Yield the given page and the ones after it, following next links in a background thread up to `depth` pages
+    ahead of the consumer."""
+    pages = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        # Give up once the consumer is gone rather than block on a full queue forever
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def worker():
+        current = paging
+
+        try:
+            while current.next and not stop.is_set():
+                current = fetch(current.next)
+                put(current)
+        except Exception as e:
+            put(e)
+        finally:
+            put(None)
+
+    threading.Thread(target=worker, daemon=True).start()
+
+    try:
+        yield paging
+
+        while True:
+            page = pages.get()
+
+            if page is None:
+                break
+
+            if isinstance(page, Exception):
+                raise page
+
+            yield page
+    finally:
+        stop.set()
+
+
+async def _afetch_sequential(
+    paging: Paging, fetch: Callable[[str], Awaitable[Paging]]
+) -> AsyncGenerator[Paging, None]:
+    """Asynchronously yield the given page and the ones after it by following next links."""
+    yield paging
+
+    while paging.next:
+        paging = await fetch(paging.next)
+        yield paging
+
+
+async def _afetch_parallel(
+    paging: Paging, fetch: Callable[[str], Awaitable[Paging]], workers: int, depth: int
+) -> AsyncGenerator[Paging, None]:
+    """Asynchronously yield the given page and the ones after it, in order, with up to `workers` requests in flight
+    and `depth` pages kept ahead of the consumer."""
+    urls = _page_urls(paging)
+    semaphore = asyncio.Semaphore(workers)
+
+    async def bounded_fetch(url: str) -> Paging:
+        async with semaphore:
+            return await fetch(url)
+
+    # Start on the next pages before the consumer gets to the first one
+    pending = deque(
+        asyncio.ensure_future(bounded_fetch(url)) for url in islice(urls, depth)
+    )
+
+    try:
+        yield paging
+
+        while pending:
+            page = await pending.popleft()
+            pending.extend(
+                asyncio.ensure_future(bounded_fetch(url)) for url in islice(urls, 1)
+            )
+
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _afetch_ahead(
+    paging: Paging, fetch: Callable[[str], Awaitable[Paging]], depth: int
+) -> AsyncGenerator[Paging, None]:
+    """Asynchronously yield the given page and the ones after it, following next links in a background task up to
+    `depth` pages ahead of the consumer."""
+    pages = asyncio.Queue(maxsize=depth)
+
+    async def worker():
+        current = paging
+
+        try:
+            while current.next:
+                current = await fetch(current.next)
+                await pages.put(current)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await pages.put(e)
+            return
+
+        await pages.put(None)
+
+    task = asyncio.ensure_future(worker())
+
+    try:
+        yield paging
+
+        while True:
+            page = await pages.get()
+
+            if page is None:
+                break
+
+            if isinstance(page, Exception):
+                raise page
+
+            yield page
+    finally:
+        task.cancel()
@@ -0,0 +1,207 @@
+"""Provide the batch loaders."""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..exceptions import SpotifyAPIError
+
+
+class BatchLoader:
+    """Merges single-object lookups made from several threads within a short window into requests for many objects.
+
+    The first lookup opens a batch. The batch is sent once the window has passed or it is full, whichever is first,
+    and every caller gets back its own object. Lookups for the same key in one batch are only requested once.
+
+    Args:
+        load_many: Requests the objects for a list of keys and returns them in the same order, with None for keys
+            that have no object.
+        max_size: The maximum number of keys requested at once.
+        window: The number of seconds to wait for more lookups before sending a batch.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[List[str]], List[Optional[Any]]],
+        max_size: int,
+        window: float,
+    ):
+        self._load_many = load_many
+        self._max_size = max_size
+        self._window = window
+
+        self._batch = None
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Any:
+        """Get the object for a key as part of the next batch.
+
+        Args:
+            key: The key of the object, usually its Spotify ID.
+
+        Returns:
+            The object for the key.
+
+        Raises:
+            SpotifyAPIError: If the API has no object for the key or the request failed.
+        """
+        full = None
+
+        with self._lock:
+            if self._batch is None:
+                self._batch = {}
+                self._timer = threading.Timer(self._window, self._flush, (self._batch,))
+                self._timer.daemon = True
+                self._timer.start()
+
+            future = self._batch.get(key)
+
+            if future is None:
+                future = self._batch[key] = Future()
+
+                if len(self._batch) >= self._max_size:
+                    self._timer.cancel()
+                    full, self._batch = self._batch, None
+
+        # The caller that fills the batch sends it instead of waiting for the timer
+        if full is not None:
+            _dispatch(full, self._load_many)
+
+        return future.result()
+
+    def _flush(self, batch: Dict[str, Future]) -> None:
+        with self._lock:
+            # The batch was already sent when it filled up
+            if self._batch is not batch:
+                return
+
+            self._batch = None
+
+        _dispatch(batch, self._load_many)
+
+
+class AsyncBatchLoader:
+    """Merges single-object lookups made from several tasks within a short window into requests for many objects.
+
+    The asyncio counterpart of BatchLoader. It must be used from a single event loop.
+
+    Args:
+        load_many: A coroutine function that requests the objects for a list of keys and returns them in the same
+            order, with None for keys that have no object.
+        max_size: The maximum number of keys requested at once.
+        window: The number of seconds to wait for more lookups before sending a batch.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[List[str]], Awaitable[List[Optional[Any]]]],
+        max_size: int,
+        window: float,
+    ):
+        self._load_many = load_many
+        self._max_size = max_size
+        self._window = window
+
+        self._batch = None
+        self._timer = None
+
+    async def load(self, key: str) -> Any:
+        """Get the object for a key as part of the next batch.
+
+        Args:
+            key: The key of the object, usually its Spotify ID.
+
+        Returns:
+            The object for the key.
+
+        Raises:
+            SpotifyAPIError: If the API has no object for the key or the request failed.
+        """
+        loop = asyncio.get_event_loop()
+
+        if self._batch is None:
+            self._batch = {}
+            self._timer = loop.call_later(self._window, self._flush)
+
+        future = self._batch.get(key)
+
+        if future is None:
+            future = self._batch[key] = loop.create_future()
+
+            if len(self._batch) >= self._max_size:
+                self._timer.cancel()
+                self._flush()
+
+        # Shielded so a caller that is cancelled doesn't cancel the lookup for others waiting on the same key
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        batch, self._batch = self._batch, None
+
+        asyncio.ensure_future(_adispatch(batch, self._load_many))
+
+
+def _dispatch(
+    batch: Dict[str, Future], load_many: Callable[[List[str]], List[Optional[Any]]]
+) -> None:
+    """Load a batch and resolve the future of each of its keys."""
+    keys = list(batch)
+
+    try:
+        results = load_many(keys)
+    except BaseException as e:
+        if len(keys) > 1 and _malformed(e):
+            for key in keys:
+                _dispatch({key: batch[key]}, load_many)
+            return
+
+        for future in batch.values():
+            future.set_exception(e)
+        return
+
+    for key, result in zip(keys, results):
+        _resolve(batch[key], key, result)
+
+
+async def _adispatch(
+    batch: Dict[str, asyncio.Future],
+    load_many: Callable[[List[str]], Awaitable[List[Optional[Any]]]],
+) -> None:
+    """Asynchronously load a batch and resolve the future of each of its keys."""
+    keys = list(batch)
+
+    try:
+        results = await load_many(keys)
+    except BaseException as e:
+        if len(keys) > 1 and _malformed(e):
+            await asyncio.gather(
+                *[_adispatch({key: batch[key]}, load_many) for key in keys]
+            )
+            return
+
+        for future in batch.values():
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    for key, result in zip(keys, results):
+        _resolve(batch[key], key, result)
+
+
+def _malformed(error: BaseException) -> bool:
+    """Check whether a batch failed because of a malformed key, which fails the whole request with a 400. Loading the
+    keys one by one then only fails the caller of that key. Any other error, such as an outage, would only fail every
+    key again, so the whole batch fails with it."""
+    return isinstance(error, SpotifyAPIError) and error.status == 400
+
+
+def _resolve(future, key: str, result: Optional[Any]) -> None:
+    if future.done():
+        return
+
+    if result is None:
+        # Match the error the single-object endpoints raise for IDs that don't exist
+        future.set_exception(SpotifyAPIError(f"non existing id: {key}"))
+    else:
+        future.set_result(result)
@@ -0,0 +1,333 @@
+"""Provide the response caches."""
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Mapping, NamedTuple, Optional
+from urllib.parse import urlencode, urlsplit
+
+from .codec import Codec, default_codec
+
+
+class CachedResponse(NamedTuple):
+    """A response kept by a cache: its ETag header if it had one, its decoded body and whether it may be used without
+    asking the API if it changed."""
+
+    etag: Optional[str]
+    data: Any
+    fresh: bool
+
+
+def cache_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Get the cache key of a request.
+
+    Args:
+        url: The URL of the request.
+        params: The query parameters of the request. None values are dropped, as they are when sending.
+
+    Returns:
+        The URL with its query parameters in a stable order.
+    """
+    if not params:
+        return url
+
+    query = urlencode(
+        sorted((key, str(value)) for key, value in params.items() if value is not None)
+    )
+
+    return f"{url}?{query}" if query else url
+
+
+class ETagCache:
+    """Keeps the ETag and decoded body of GET responses so repeated requests can be revalidated with If-None-Match.
+    When the API answers 304 Not Modified the cached body is reused, so nothing is downloaded or parsed again.
+
+    The least recently used responses are evicted once the cache is full. A single cache is safe to share across
+    threads and across endpoint instances. Cached bodies are shared between callers and must not be modified.
+
+    Args:
+        maxsize: The maximum number of responses to keep.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a cached response.
+
+        Args:
+            key: The cache key of the request.
+
+        Returns:
+            The cached response, which always has to be revalidated, or None if it is not cached.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            self._entries.move_to_end(key)
+            etag, data = self._entries[key]
+
+            return CachedResponse(etag, data, False)
+
+    def set(self, key: str, etag: Optional[str], data: Any) -> None:
+        """Cache a response, evicting the least recently used one if the cache is full. Responses without an ETag are
+        not cached since they cannot be revalidated.
+
+        Args:
+            key: The cache key of the request.
+            etag: The ETag header of the response.
+            data: The decoded body of the response.
+        """
+        if etag is None:
+            return
+
+        with self._lock:
+            self._entries[key] = (etag, data)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """Keeps GET responses in an SQLite database so they outlive the process.
+
+    Each response is used as is for the time to live of its endpoint family, found by the longest path prefix in
+    `ttls`, without sending a request. Once that runs out, responses that came with an ETag are revalidated with
+    If-None-Match, so an unchanged body is still not downloaded again. Responses of paths without a time to live are
+    only kept if they can be revalidated.
+
+    Responses of the paths in USER_PATHS, such as /me/player, depend on the user the token belongs to. The database may
+    be shared by sessions of other users, so they are never cached.
+
+    The least recently used responses are evicted once the bodies take up more than `max_size` bytes. The database may
+    be shared by several processes, and a single cache is safe to share across threads and across endpoint instances.
+    Cached bodies are decoded again on every hit, so callers may modify them.
+
+    Args:
+        path: The path of the database file. It is created if it does not exist.
+        ttls: The time to live, in seconds, of each endpoint family by path prefix. Default: DEFAULT_TTLS.
+        max_size: The maximum total size, in bytes, of the cached bodies.
+        codec: The codec cached bodies are encoded and decoded with. Default: an OrjsonCodec if orjson is installed,
+            otherwise a JSONCodec.
+    """
+
+    DEFAULT_TTLS = {
+        # Catalog data hardly ever changes
+        "/albums": 7 * 24 * 60 * 60,
+        "/artists": 24 * 60 * 60,
+        "/audio-analysis": 30 * 24 * 60 * 60,
+        "/audio-features": 30 * 24 * 60 * 60,
+        "/tracks": 7 * 24 * 60 * 60,
+    }
+
+    # The path prefixes of responses that belong to the user of the token
+    USER_PATHS = ("/me",)
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_size: int = 512 * 1024 * 1024,
+        codec: Optional[Codec] = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        ttls = self.DEFAULT_TTLS if ttls is None else ttls
+
+        # Check longer prefixes first so /albums/{id}/tracks can be given a time to live of its own apart from /albums
+        self._ttls = sorted(ttls.items(), key=lambda item: len(item[0]), reverse=True)
+        self._max_size = max_size
+        self._codec = codec if codec else default_codec()
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+
+        with self._lock:
+            # Let other processes read while one of them writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "etag TEXT, "
+                "body TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "expires REAL NOT NULL, "
+                "accessed REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def ttl(self, key: str) -> float:
+        """Get the time to live of a response.
+
+        Args:
+            key: The cache key of the request.
+
+        Returns:
+            The time to live, in seconds, of the endpoint family of the request, or 0 if it has none.
+        """
+        path = self._path(key)
+
+        for prefix, ttl in self._ttls:
+            if self._matches(path, prefix):
+                return ttl
+
+        return 0
+
+    def cacheable(self, key: str) -> bool:
+        """Check whether a response may be kept in the cache at all.
+
+        Args:
+            key: The cache key of the request.
+
+        Returns:
+            Whether the path of the request is not in USER_PATHS.
+        """
+        path = self._path(key)
+
+        return not any(self._matches(path, prefix) for prefix in self.USER_PATHS)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a cached response.
+
+        Args:
+            key: The cache key of the request.
+
+        Returns:
+            The cached response, or None if it is not cached or has expired and cannot be revalidated.
+        """
+        if not self.cacheable(key):
+            return None
+
+        now = time.time()
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, body, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            etag, body, expires = row
+
+            if expires <= now and etag is None:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+
+        return CachedResponse(etag, self._codec.loads(body), expires > now)
+
+    def set(self, key: str, etag: Optional[str], data: Any) -> None:
+        """Cache a response, evicting the least recently used ones if the cache is full. Storing a response again, such
+        as after a 304 Not Modified, restarts its time to live.
+
+        Args:
+            key: The cache key of the request.
+            etag: The ETag header of the response, if any.
+            data: The decoded body of the response.
+        """
+        if not self.cacheable(key):
+            return
+
+        ttl = self.ttl(key)
+
+        if ttl <= 0 and etag is None:
+            return
+
+        body = self._codec.dumps(data)
+        size = len(body)
+
+        if size > self._max_size:
+            return
+
+        now = time.time()
+
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, etag, body, size, now + ttl, now),
+                )
+                self._evict()
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+            self._connection.execute("COMMIT")
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _path(key: str) -> str:
+        path = urlsplit(key).path
+
+        # Match against the path below the API version, e.g. /tracks/{id} for https://api.spotify.com/v1/tracks/{id}
+        if path.startswith("/v1/"):
+            path = path[3:]
+
+        return path
+
+    @staticmethod
+    def _matches(path: str, prefix: str) -> bool:
+        return path == prefix or path.startswith(prefix.rstrip("/") + "/")
+
+    def _evict(self) -> None:
+        total = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+        if total <= self._max_size:
+            return
+
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed"
+        )
+        evicted = []
+
+        for key, size in rows:
+            if total <= self._max_size:
+                break
+
+            evicted.append((key,))
+            total -= size
+
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
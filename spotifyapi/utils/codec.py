@@ -0,0 +1,89 @@
+"""Provide the JSON codecs."""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """Encodes and decodes JSON with the standard library."""
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """Encode an object to UTF-8 JSON.
+
+        Args:
+            obj: The object to encode.
+
+        Returns:
+            The encoded JSON.
+        """
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    @staticmethod
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON.
+
+        Args:
+            data: The JSON to decode.
+
+        Returns:
+            The decoded object.
+
+        Raises:
+            ValueError: If the data is not valid JSON.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """Encodes and decodes JSON with orjson, which is several times faster than the standard library on large payloads
+    such as audio analyses and playlists. It requires orjson, which can be installed with `pip install
+    spotifyapi[fast]`."""
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson")
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        """Encode an object to UTF-8 JSON.
+
+        Args:
+            obj: The object to encode.
+
+        Returns:
+            The encoded JSON.
+        """
+        return orjson.dumps(obj)
+
+    @staticmethod
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON.
+
+        Args:
+            data: The JSON to decode.
+
+        Returns:
+            The decoded object.
+
+        Raises:
+            ValueError: If the data is not valid JSON.
+        """
+        # orjson.JSONDecodeError is a subclass of ValueError, like json.JSONDecodeError
+        return orjson.loads(data)
+
+
+Codec = Union[JSONCodec, OrjsonCodec]
+
+
+def default_codec() -> Codec:
+    """Get the fastest codec available.
+
+    Returns:
+        An OrjsonCodec if orjson is installed, otherwise a JSONCodec.
+    """
+    return OrjsonCodec() if orjson is not None else JSONCodec()
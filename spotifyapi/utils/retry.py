@@ -0,0 +1,95 @@
+"""Provide the retry policy."""
+import random
+import time
+import requests
+from typing import Callable, Iterable
+
+
+class RetryPolicy:
+    """Retries requests that failed for transient reasons, waiting with exponential backoff and full jitter in between.
+
+    Only idempotent requests are retried automatically. Endpoints retry GET, PUT and DELETE requests and leave POST
+    requests alone unless the caller opts in.
+
+    Args:
+        total: The maximum number of retries for a request. 0 disables retrying.
+        backoff_factor: The base, in seconds, of the exponential backoff. The wait before retry n is a random value
+            between 0 and backoff_factor * 2 ** n.
+        max_backoff: The longest wait, in seconds, between two attempts.
+        statuses: The HTTP status codes that are retried.
+    """
+
+    # Connection resets, timeouts and bodies cut off mid-transfer
+    exceptions = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    )
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        statuses: Iterable[int] = (500, 502, 503, 504),
+    ):
+        if total < 0:
+            raise ValueError("total must be 0 or more")
+
+        self._total = total
+        self._backoff_factor = backoff_factor
+        self._max_backoff = max_backoff
+        self._statuses = frozenset(statuses)
+
+    @property
+    def total(self) -> int:
+        """The maximum number of retries for a request."""
+        return self._total
+
+    def backoff(self, attempt: int) -> float:
+        """Get the number of seconds to wait before a retry.
+
+        Args:
+            attempt: The number of retries already made for the request.
+
+        Returns:
+            A random wait between 0 and the exponential backoff for the attempt.
+        """
+        return random.uniform(
+            0, min(self._max_backoff, self._backoff_factor * 2**attempt)
+        )
+
+    def is_retryable(self, status_code: int) -> bool:
+        """Check if a response status is worth retrying."""
+        return status_code in self._statuses
+
+    def call(
+        self, send: Callable[[], requests.models.Response]
+    ) -> requests.models.Response:
+        """Send a request, retrying transient failures.
+
+        Args:
+            send: Sends the request and returns its response.
+
+        Returns:
+            The first response that is not retryable, or the last response once retries are used up.
+
+        Raises:
+            requests.exceptions.RequestException: If the last attempt failed with a connection error or timeout.
+        """
+        attempt = 0
+
+        while True:
+            try:
+                response = send()
+            except self.exceptions:
+                if attempt >= self._total:
+                    raise
+            else:
+                if attempt >= self._total or not self.is_retryable(
+                    response.status_code
+                ):
+                    return response
+
+            time.sleep(self.backoff(attempt))
+            attempt += 1
@@ -0,0 +1,116 @@
+"""Provide the request scheduler."""
+import asyncio
+import threading
+import time
+import requests
+from typing import Callable, Mapping, Optional
+
+
+class RequestScheduler:
+    """Paces requests with a token bucket and holds every request back while the API asks clients to slow down.
+
+    A single scheduler is shared by everything that sends requests through an endpoint, including paging, and is safe
+    to share across threads and across endpoint instances.
+
+    Args:
+        rate: The sustained number of requests allowed per second. If not given, requests are only held back when the
+            API responds with 429 Too Many Requests.
+        burst: The number of requests that may be sent at once before pacing starts.
+        default_retry_after: Seconds to wait after a 429 response that has no Retry-After header.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        default_retry_after: float = 1.0,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self._interval = 1 / rate if rate else 0.0
+        self._tolerance = (burst - 1) * self._interval
+        self._default_retry_after = default_retry_after
+
+        # The bucket is kept as the theoretical time the next request would be sent at the sustained rate
+        self._next = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve a slot for one request.
+
+        Returns:
+            The number of seconds the caller must wait before sending.
+        """
+        with self._lock:
+            now = time.monotonic()
+            send_at = max(now, self._next - self._tolerance, self._paused_until)
+            self._next = max(self._next, send_at) + self._interval
+
+            return send_at - now
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for the given number of seconds.
+
+        Args:
+            seconds: How long to wait, usually the value of a Retry-After header.
+        """
+        with self._lock:
+            until = time.monotonic() + seconds
+
+            if until > self._paused_until:
+                self._paused_until = until
+                # Resume at the sustained rate rather than with a burst
+                self._next = max(self._next, until + self._tolerance)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+
+        while delay > 0:
+            time.sleep(delay)
+            # A 429 may have paused everything while this request was waiting
+            delay = self._paused_until - time.monotonic()
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        delay = self.reserve()
+
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._paused_until - time.monotonic()
+
+    def retry_after(self, headers: Mapping[str, str]) -> float:
+        """Get the number of seconds to wait from the headers of a 429 response."""
+        try:
+            return max(0.0, float(headers["Retry-After"]))
+        except (KeyError, ValueError):
+            return self._default_retry_after
+
+    def send(
+        self, method: Callable[..., requests.models.Response], url: str, **kwargs
+    ) -> requests.models.Response:
+        """Send a request when the scheduler allows it. Responses of 429 Too Many Requests pause the scheduler for the
+        time given by the API and the request is queued again instead of failing.
+
+        Args:
+            method: The session method used to send the request, such as OAuth2Session.get.
+            url: The URL of the request.
+            kwargs: Passed through to `method`.
+
+        Returns:
+            The first response that was not a 429.
+        """
+        while True:
+            self.acquire()
+
+            response = method(url, **kwargs)
+
+            if response.status_code != requests.codes.too_many_requests:
+                return response
+
+            self.pause(self.retry_after(response.headers))
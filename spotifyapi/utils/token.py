@@ -0,0 +1,332 @@
+"""Provide the token manager and token stores."""
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Callable, Optional
+from requests_oauthlib import OAuth2Session
+
+from ..authorization.client_credentials import ClientCredentialsSession
+from .codec import Codec, default_codec
+
+# The lock of each session that its token is refreshed under, shared by every manager of the session
+_session_locks = weakref.WeakKeyDictionary()
+_session_locks_lock = threading.Lock()
+
+
+def _session_lock(oauth: OAuth2Session) -> threading.Lock:
+    with _session_locks_lock:
+        lock = _session_locks.get(oauth)
+
+        if lock is None:
+            lock = _session_locks[oauth] = threading.Lock()
+
+        return lock
+
+
+class SQLiteTokenStore:
+    """Keeps tokens in an SQLite database so processes using the same client can share them.
+
+    Tokens are updated inside a write transaction, which waits for the ones other processes are in. So when the token
+    of a fleet of workers expires, the first one to get there refreshes it and the others find the new token stored
+    instead of refreshing it again. A single store is safe to share across threads and across token managers.
+
+    Args:
+        path: The path of the database file. It is created if it does not exist.
+        codec: The codec tokens are encoded and decoded with. Default: an OrjsonCodec if orjson is installed,
+            otherwise a JSONCodec.
+    """
+
+    def __init__(self, path: str, codec: Optional[Codec] = None):
+        self._codec = codec if codec else default_codec()
+        self._lock = threading.Lock()
+
+        # Processes wait on each other for as long as a refresh may take
+        self._connection = sqlite3.connect(
+            path, timeout=60, isolation_level=None, check_same_thread=False
+        )
+
+        with self._lock:
+            # Let other processes read while one of them writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                "key TEXT PRIMARY KEY, "
+                "token TEXT NOT NULL, "
+                "updated REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[dict]:
+        """Get a stored token.
+
+        Args:
+            key: The key of the token, such as the client ID it was issued to.
+
+        Returns:
+            The token, or None if none is stored.
+        """
+        with self._lock:
+            return self.__get(key)
+
+    def set(self, key: str, token: dict) -> None:
+        """Store a token, replacing the one stored before.
+
+        Args:
+            key: The key of the token.
+            token: The token.
+        """
+        with self._lock:
+            self.__set(key, token)
+
+    def update(
+        self, key: str, func: Callable[[Optional[dict]], Optional[dict]]
+    ) -> Optional[dict]:
+        """Replace a stored token while no other thread or process can read or update it through the store. Use this
+        to refresh a token once for everyone sharing it.
+
+        Args:
+            key: The key of the token.
+            func: Takes the stored token, or None if none is stored, and returns the token to store instead, or None to
+                keep it.
+
+        Returns:
+            The token stored once func has run.
+        """
+        with self._lock:
+            # Take the write lock up front so no other process reads the token we are about to replace
+            self._connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                token = self.__get(key)
+                updated = func(token)
+
+                if updated is not None:
+                    self.__set(key, updated)
+                    token = updated
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+            self._connection.execute("COMMIT")
+
+            return token
+
+    def delete(self, key: str) -> None:
+        """Remove a stored token.
+
+        Args:
+            key: The key of the token.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM tokens WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __get(self, key: str) -> Optional[dict]:
+        row = self._connection.execute(
+            "SELECT token FROM tokens WHERE key = ?", (key,)
+        ).fetchone()
+
+        return self._codec.loads(row[0]) if row else None
+
+    def __set(self, key: str, token: dict) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?)",
+            (key, self._codec.dumps(dict(token)), time.time()),
+        )
+
+
+class TokenManager:
+    """Refreshes the token of a session before it expires, so requests are not sent with a token that is about to be
+    rejected.
+
+    Endpoints ask the manager for a fresh token before every request. Once the token is within `margin` seconds of
+    expiring, one thread refreshes it through the auto_refresh_url of the session while the others wait, and the
+    token_updater of the session is called with the new token. A session without a token yet gets one the same way,
+    which is how a ClientCredentialsSession fetches its first one. Tokens without an expires_at are never refreshed
+    ahead of time, and neither are tokens without a refresh token, except those of a ClientCredentialsSession, which
+    fetches a new token instead.
+
+    With a store, the token is shared with every process using the same store and key. A process whose token is
+    expiring takes the token another process already stored if it is still fresh, and only refreshes it otherwise.
+    This also picks up the refresh token if the API rotated it.
+
+    With background, a daemon thread refreshes the token ahead of requests, at twice the margin before it expires, so
+    requests do not wait for it. Stop it with stop, or use the manager as a context manager.
+
+    Args:
+        oauth: The session whose token is managed.
+        store: If given, the store the token is shared through, such as a SQLiteTokenStore.
+        key: The key of the token in the store, such as the ID of the user it was issued to. Required with a store,
+            except for a ClientCredentialsSession, whose token belongs to the client. Default: the client ID of a
+            ClientCredentialsSession.
+        margin: The number of seconds before it expires that the token is refreshed. Default: DEFAULT_MARGIN.
+        background: Whether to start refreshing the token in a background thread right away.
+
+    Raises:
+        ValueError: If a store is given for a session other than a ClientCredentialsSession without a key, since
+            every user of the client would share one token otherwise.
+    """
+
+    DEFAULT_MARGIN = 10
+
+    # The number of seconds the background thread waits before trying again after a refresh failed
+    RETRY_DELAY = 5
+
+    def __init__(
+        self,
+        oauth: OAuth2Session,
+        store: Optional[SQLiteTokenStore] = None,
+        key: Optional[str] = None,
+        margin: float = DEFAULT_MARGIN,
+        background: bool = False,
+    ):
+        # Tokens of users are issued to the same client, so the client ID can't tell them apart
+        if (
+            store is not None
+            and not key
+            and not isinstance(oauth, ClientCredentialsSession)
+        ):
+            raise ValueError(
+                "key is required to share the token of a user through a store"
+            )
+
+        self._oauth = oauth
+        self._store = store
+        self._key = key if key else oauth.client_id
+        self._margin = margin
+        self._lock = _session_lock(oauth)
+        self._stopped = threading.Event()
+        self._thread = None
+
+        if background:
+            self.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def expiring(self, margin: Optional[float] = None) -> bool:
+        """Check whether the token of the session expires within the margin.
+
+        Args:
+            margin: The number of seconds to check. Default: the margin of the manager.
+
+        Returns:
+            Whether the session has no token yet or its token has an expires_at within the margin.
+        """
+        if not self._oauth.authorized:
+            return True
+
+        expires_at = (self._oauth.token or {}).get("expires_at")
+        margin = self._margin if margin is None else margin
+
+        return expires_at is not None and expires_at - margin <= time.time()
+
+    def ensure(self, margin: Optional[float] = None) -> None:
+        """Refresh the token of the session if it expires within the margin. This is cheap when it does not, so it is
+        called before every request.
+
+        Args:
+            margin: The number of seconds before it expires that the token is refreshed. Default: the margin of the
+                manager.
+        """
+        if not self.expiring(margin):
+            return
+
+        if not self.__can_refresh() and self._store is None:
+            return
+
+        with self._lock:
+            # Another thread may have refreshed the token while this one waited for the lock
+            if not self.expiring(margin):
+                return
+
+            previous = self._oauth.token
+
+            # Both refreshing and taking the stored token replace the token of the session
+            if self._store is None:
+                self.__refresh()
+            else:
+                self._store.update(
+                    self._key, lambda stored: self.__update(stored, margin)
+                )
+
+            if self._oauth.token is previous:
+                return
+
+            if self._oauth.token_updater:
+                self._oauth.token_updater(self._oauth.token)
+
+    def start(self) -> None:
+        """Start refreshing the token in a background thread, if it isn't already."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self.__run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop refreshing the token in the background and wait for the thread to finish."""
+        self._stopped.set()
+
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __update(
+        self, stored: Optional[dict], margin: Optional[float]
+    ) -> Optional[dict]:
+        # Take the token another process stored only if it is fresher than ours, never an older one
+        if stored and self.__expires_at(stored) > self.__expires_at(self._oauth.token):
+            self._oauth.token = stored
+
+            if not self.expiring(margin):
+                return None
+
+        if not self.__can_refresh():
+            return None
+
+        return self.__refresh()
+
+    def __can_refresh(self) -> bool:
+        if not self._oauth.auto_refresh_url:
+            return False
+
+        # The client credentials flow has no refresh token, since the session fetches a new token instead
+        return isinstance(self._oauth, ClientCredentialsSession) or bool(
+            (self._oauth.token or {}).get("refresh_token")
+        )
+
+    def __refresh(self) -> dict:
+        return self._oauth.refresh_token(
+            self._oauth.auto_refresh_url, **self._oauth.auto_refresh_kwargs
+        )
+
+    def __run(self) -> None:
+        margin = 2 * self._margin
+
+        while not self._stopped.is_set():
+            try:
+                self.ensure(margin)
+            except Exception:
+                # Requests still refresh the token themselves if the background thread can't
+                delay = self.RETRY_DELAY
+            else:
+                expires_at = (self._oauth.token or {}).get("expires_at")
+                delay = (
+                    None if expires_at is None else expires_at - margin - time.time()
+                )
+
+            # Don't spin if the API issues tokens that expire within the margin
+            self._stopped.wait(None if delay is None else max(delay, 1))
+
+    @staticmethod
+    def __expires_at(token: Optional[dict]) -> float:
+        return (token or {}).get("expires_at") or 0